@@ -1,15 +1,63 @@
+from __future__ import annotations
+
+import ast
+import bisect
 import csv
+import functools
+import html
+import hashlib
+import importlib
+import inspect
+import io
+import json
+import math
+from collections import deque
+import mmap
+import os
 import random
-from typing import List
+import secrets
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from PIL import Image as PILImage
-import numpy as np
 import wave
+import zlib
 import datetime
 import string
 import re
 
 
+class _LazyModule:
+    """
+    Stands in for a heavy module and imports it on first attribute access.
+    
+    Only the generators that actually need NumPy or Pillow pay their import
+    cost; importing this module for text generation stays cheap.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+np = _LazyModule('numpy')
+PILImage = _LazyModule('PIL.Image')
+
+LIB_DIR = Path(__file__).resolve().parent / 'libs'
+HEAVY_MODULES = ('numpy', 'PIL.Image', 'concurrent.futures', 'sqlite3')
+
+
 def fix_text(text: str) -> str:
     """
     Formats text by removing specific unwanted characters.
@@ -23,6 +71,45 @@ def fix_text(text: str) -> str:
     return text.replace("'", "").replace("\\[", "").replace("\\]", "")
 
 
+@contextmanager
+def _open_sink(dest: Union[str, os.PathLike, io.IOBase]) -> Iterator[Callable[[str], int]]:
+    """
+    Opens a destination for streamed text output.
+    
+    Args:
+        dest: A file path, or an open text or binary file object (left open).
+    
+    Yields:
+        Callable[[str], int]: Writes a chunk and returns the UTF-8 bytes written. Its ``flush``
+        attribute pushes buffered output to the destination.
+    """
+    if isinstance(dest, (str, os.PathLike)):
+        with open(dest, 'wb', buffering=1 << 20) as f:
+            write = lambda chunk: f.write(chunk.encode('utf-8'))
+            write.flush = f.flush
+            yield write
+    elif isinstance(dest, io.TextIOBase):
+        def write(chunk: str) -> int:
+            dest.write(chunk)
+            return len(chunk.encode('utf-8'))
+        write.flush = dest.flush
+        yield write
+    else:
+        write = lambda chunk: dest.write(chunk.encode('utf-8'))
+        write.flush = getattr(dest, 'flush', lambda: None)
+        yield write
+
+
+def _utf8_len(text: str) -> int:
+    """Returns the UTF-8 encoded length of text without encoding ASCII."""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def _slug(text: str) -> str:
+    """Lowercases text and joins its alphanumeric runs with underscores."""
+    return re.sub(r'[^0-9a-z]+', '_', text.lower()).strip('_')
+
+
 def cap_text(text: str) -> str:
     """
     Formats and capitalizes the text.
@@ -36,614 +123,4906 @@ def cap_text(text: str) -> str:
     return fix_text(text).capitalize()
 
 
-class LibraryLoader:
+class SoupRandom:
     """
-    Loads and caches word libraries from CSV files.
+    Seedable random streams owned by a single generator instance.
+
+    ``py`` is a ``random.Random`` for scalar draws and ``np`` a
+    ``numpy.random.Generator`` for vectorized draws. Both derive from the same
+    ``(entropy, spawn_key)`` pair, so an integer seed fully determines the
+    output, and ``child(i)`` cheaply derives independent, addressable streams.
     """
-    _cache: dict = {}
 
-    @staticmethod
-    def load_lib(filename: str) -> List[str]:
+    def __init__(self, seed: Optional[int] = None, spawn_key: tuple = ()):
         """
-        Loads a list of words from a CSV file located in the 'libs' directory.
+        Creates random streams from a seed.
         
         Args:
-            filename (str): The name of the CSV file without extension.
-        
-        Returns:
-            List[str]: A list of words.
-        
-        Raises:
-            FileNotFoundError: If the CSV file does not exist.
+            seed (Optional[int]): The seed, or None for fresh OS entropy.
+            spawn_key (tuple): The path of child indices from the root stream.
         """
-        if filename in LibraryLoader._cache:
-            return LibraryLoader._cache[filename]
-        
-        path = Path('libs') / f'{filename}.csv'
-        if not path.exists():
-            raise FileNotFoundError(f"Library file '{path}' not found.")
-        
-        with path.open(newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            lib = [fix_text(word.strip()) for row in reader for word in row if word.strip()]
-        
-        LibraryLoader._cache[filename] = lib
-        return lib
-
-
-class TextGenerator:
-    """
-    Generates various types of text elements such as numbers, nouns, adjectives, etc.
-    """
+        self.seed = seed
+        self.entropy = secrets.randbits(128) if seed is None else seed
+        self.spawn_key = tuple(spawn_key)
+        self._py = None
+        self._np = None
+        self._spawned = 0
 
-    def number(self, length: int) -> str:
+    @classmethod
+    def wrap(cls, rng=None) -> "SoupRandom":
         """
-        Generates a string of random numbers.
+        Coerces a seed or an existing RNG into a SoupRandom.
         
         Args:
-            length (int): The number of digits to generate.
+            rng: None, an int seed, a SoupRandom, a ``random.Random`` or a
+                ``numpy.random.Generator``. Given RNGs are used as-is.
         
         Returns:
-            str: A string of random digits.
+            SoupRandom: The wrapped streams.
+        
+        Raises:
+            TypeError: If ``rng`` is not a supported type.
         """
-        return ''.join(str(random.randint(0, 9)) for _ in range(length))
+        if isinstance(rng, SoupRandom):
+            return rng
+        if rng is None or isinstance(rng, int):
+            return cls(rng)
+        if isinstance(rng, random.Random):
+            wrapped = cls()
+            wrapped.entropy = rng.getrandbits(128)
+            wrapped._py = rng
+            return wrapped
+        if hasattr(rng, 'bit_generator'):
+            seed_seq = rng.bit_generator.seed_seq
+            wrapped = cls()
+            wrapped.entropy = seed_seq.entropy
+            wrapped.spawn_key = tuple(seed_seq.spawn_key)
+            wrapped._np = rng
+            return wrapped
+        raise TypeError(f"Unsupported RNG type: {type(rng).__name__}")
 
-    def noun(self, length: int) -> str:
+    def _seed_sequence(self):
+        return np.random.SeedSequence(self.entropy, spawn_key=self.spawn_key)
+
+    @property
+    def np(self):
+        """NumPy generator for vectorized draws"""
+        if self._np is None:
+            self._np = np.random.default_rng(self._seed_sequence())
+        return self._np
+
+    @property
+    def py(self) -> random.Random:
+        """Standard-library generator for scalar draws"""
+        if self._py is None:
+            # Seeded from a string (hashed with SHA-512) so scalar-only
+            # generators never import NumPy.
+            self._py = random.Random(f"soup:{self.entropy}:{self.spawn_key}")
+        return self._py
+
+    def child(self, index: int) -> "SoupRandom":
         """
-        Generates a string of random nouns.
+        Derives the independent stream at a given child index.
         
         Args:
-            length (int): The number of nouns to generate.
+            index (int): The child index; equal indices give equal streams.
         
         Returns:
-            str: A string of random nouns separated by spaces.
+            SoupRandom: The child streams.
         """
-        nouns = LibraryLoader.load_lib("nouns")
-        return fix_text(" ".join(random.choice(nouns).lower() for _ in range(length)))
+        child = SoupRandom(self.seed, self.spawn_key + (index,))
+        child.entropy = self.entropy
+        return child
 
-    def adjective(self, length: int) -> str:
+    def spawn(self, n: int) -> List["SoupRandom"]:
         """
-        Generates a string of random adjectives.
+        Derives the next ``n`` independent child streams.
         
         Args:
-            length (int): The number of adjectives to generate.
+            n (int): The number of children.
         
         Returns:
-            str: A string of random adjectives separated by spaces.
+            List[SoupRandom]: The child streams.
         """
-        adjectives = LibraryLoader.load_lib("adjectives")
-        return fix_text(" ".join(random.choice(adjectives).lower() for _ in range(length)))
+        children = [self.child(self._spawned + i) for i in range(n)]
+        self._spawned += n
+        return children
 
-    def adverb(self, length: int) -> str:
+
+class InstrumentationStats:
+    """
+    Call counts, cumulative seconds and bytes produced, keyed by ``Class.method``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+
+    def add(self, name: str, seconds: float = 0.0, nbytes: int = 0):
+        """Adds one call to an entry."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._entries[name] = {'calls': 0, 'seconds': 0.0, 'bytes': 0}
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            entry['bytes'] += nbytes
+
+    def snapshot(self) -> dict:
         """
-        Generates a string of random adverbs.
-        
-        Args:
-            length (int): The number of adverbs to generate.
+        Returns a copy of the collected entries.
         
         Returns:
-            str: A string of random adverbs separated by spaces.
+            dict: ``{name: {'calls', 'seconds', 'bytes'}}``. Times are
+            inclusive, so a batch method called by a scalar one counts in both.
         """
-        adverbs = LibraryLoader.load_lib("adverbs")
-        return fix_text(" ".join(random.choice(adverbs).lower() for _ in range(length)))
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._entries.items()}
 
-    def verb(self, length: int) -> str:
+
+class Instrumentation:
+    """
+    Opt-in instrumentation of generator hot paths.
+
+    While at least one ``instrument()`` scope is active, the public methods of
+    the ``TARGETS`` classes are replaced by timing wrappers; outside a scope
+    the original functions are restored, so disabled instrumentation costs
+    nothing. Library cache hits/misses and image/audio encodes are recorded
+    explicitly through ``count`` and ``span``. Generation running inside
+    ``ParallelGenerator`` worker processes is not captured.
+    """
+
+    TARGETS = ('LibraryLoader', 'TextGenerator', 'PhraseGenerator', 'DataGenerator', 'CodeGenerator',
+               'TimeGenerator', 'SocialMediaGenerator', 'FileGenerator', 'Audio', 'Schema', 'ParallelGenerator',
+               'AsyncStream', 'DatabaseGenerator', 'LogStream', 'ArtifactCache', 'SocialGraph',
+               'CorpusGenerator')
+    _lock = threading.RLock()
+    _active: List[InstrumentationStats] = []
+    _originals: list = []
+    # Bytes reported by spans on this thread, so a wrapped method that streams
+    # its output (and returns a count or None) is credited with them.
+    _emitted = threading.local()
+
+    @classmethod
+    def record(cls, name: str, seconds: float = 0.0, nbytes: int = 0):
+        """Records one call in every active scope."""
+        for stats in cls._active:
+            stats.add(name, seconds, nbytes)
+
+    @classmethod
+    def count(cls, name: str):
+        """Counts an event (e.g. a cache hit) in every active scope."""
+        if cls._active:
+            cls.record(name)
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, path=None):
         """
-        Generates a string of random verbs.
+        Times a block such as an encode and records it under ``name``.
         
         Args:
-            length (int): The number of verbs to generate.
+            name (str): The entry name.
+            path: A file whose size is recorded as the bytes produced.
         
-        Returns:
-            str: A string of random verbs separated by spaces.
+        Yields:
+            dict: Set ``['bytes']`` to report the bytes produced explicitly.
         """
-        verbs = LibraryLoader.load_lib("verbs")
-        return fix_text(" ".join(random.choice(verbs).lower() for _ in range(length)))
+        if not cls._active:
+            yield {}
+            return
+        info = {'bytes': 0}
+        start = time.perf_counter()
+        yield info
+        elapsed = time.perf_counter() - start
+        if path is not None and isinstance(path, (str, os.PathLike)) and os.path.exists(path):
+            info['bytes'] = os.path.getsize(path)
+        cls.record(name, elapsed, info['bytes'])
+        cls._emitted.bytes = getattr(cls._emitted, 'bytes', 0) + info['bytes']
 
-    def phone(self) -> str:
-        """
-        Generates a random US phone number.
-        
-        Returns:
-            str: A formatted US phone number.
-        """
-        area_code = random.randint(100, 999)
-        central_office_code = random.randint(100, 999)
-        line_number = random.randint(1000, 9999)
-        return f"({area_code}) {central_office_code}-{line_number}"
+    @staticmethod
+    def _result_bytes(name: str, result) -> int:
+        if isinstance(result, str):
+            return len(result.encode('utf-8'))
+        if isinstance(result, (bytes, bytearray)):
+            return len(result)
+        if isinstance(result, io.BytesIO):
+            return result.getbuffer().nbytes
+        if isinstance(result, int) and name.rsplit('.', 1)[-1].startswith('write'):
+            return result
+        if hasattr(result, 'nbytes'):
+            return int(result.nbytes)
+        if isinstance(result, dict):
+            return sum(Instrumentation._result_bytes(name, value) for value in result.values())
+        if isinstance(result, list):
+            return sum(len(item.encode('utf-8')) for item in result if isinstance(item, str))
+        return 0
 
-    def credit_card(self) -> str:
+    @classmethod
+    def _wrap(cls, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            emitted = getattr(cls._emitted, 'bytes', 0)
+            result = func(*args, **kwargs)
+            nbytes = cls._result_bytes(name, result) or getattr(cls._emitted, 'bytes', 0) - emitted
+            cls.record(name, time.perf_counter() - start, nbytes)
+            return result
+        return wrapper
+
+    @classmethod
+    def _patch(cls):
+        for class_name in cls.TARGETS:
+            target = globals()[class_name]
+            for attr_name, attr in list(vars(target).items()):
+                if attr_name.startswith('_'):
+                    continue
+                name = f'{class_name}.{attr_name}'
+                if isinstance(attr, (staticmethod, classmethod)):
+                    wrapped = type(attr)(cls._wrap(name, attr.__func__))
+                elif inspect.isfunction(attr):
+                    wrapped = cls._wrap(name, attr)
+                else:
+                    continue
+                cls._originals.append((target, attr_name, attr))
+                setattr(target, attr_name, wrapped)
+
+    @classmethod
+    def _unpatch(cls):
+        while cls._originals:
+            target, attr_name, attr = cls._originals.pop()
+            setattr(target, attr_name, attr)
+
+    @classmethod
+    def start(cls) -> InstrumentationStats:
         """
-        Generates a random credit card number (for testing only!).
+        Opens a measurement scope; prefer the ``instrument()`` context manager.
         
         Returns:
-            str: A formatted credit card number.
+            InstrumentationStats: The stats collected until ``stop``.
         """
-        prefix = random.choice(['4', '5', '37', '6'])  # Common card prefixes
-        length = 16 if prefix != '37' else 15
-        number = prefix + ''.join([str(random.randint(0, 9)) for _ in range(length - len(prefix))])
-        return ' '.join(number[i:i+4] for i in range(0, len(number), 4))
+        stats = InstrumentationStats()
+        with cls._lock:
+            if not cls._active:
+                cls._patch()
+            cls._active = cls._active + [stats]
+        return stats
 
-    def url(self) -> str:
+    @classmethod
+    def stop(cls, stats: InstrumentationStats):
+        """Closes a measurement scope opened by ``start``."""
+        with cls._lock:
+            cls._active = [active for active in cls._active if active is not stats]
+            if not cls._active:
+                cls._unpatch()
+
+
+@contextmanager
+def instrument() -> Iterator[InstrumentationStats]:
+    """
+    Collects generator call counts, time and bytes produced within a block.
+    
+    Example:
+        with instrument() as stats:
+            DataGenerator().people(1000)
+        stats.snapshot()['DataGenerator.people']
+    
+    Yields:
+        InstrumentationStats: The stats for this scope.
+    """
+    stats = Instrumentation.start()
+    try:
+        yield stats
+    finally:
+        Instrumentation.stop(stats)
+
+
+class CompiledLibrary:
+    """
+    A word library stored as an offsets array plus a UTF-8 blob.
+
+    File layout (little-endian): an 8-byte magic, a uint32 entry count, a
+    uint32 flags field, ``count + 1`` uint32 byte offsets, then (if
+    ``FLAG_WEIGHTS`` is set) padding to 8 bytes and ``count`` float64
+    sampling weights, then the blob. The file is memory-mapped, so lookups
+    decode entries lazily and forked workers share the same pages.
+    """
+    MAGIC = b"SOUPLIB2"
+    FLAG_WEIGHTS = 1
+    _HEADER = struct.Struct("<8sII")
+
+    def __init__(self, buffer):
         """
-        Generates a random URL.
+        Wraps a buffer holding a compiled library.
         
-        Returns:
-            str: A formatted URL.
+        Args:
+            buffer: A mmap or bytes-like object in the compiled format.
+        
+        Raises:
+            ValueError: If the buffer is not a compiled library.
         """
-        protocols = ['http', 'https']
-        domains = ['example.com', 'test.com', 'demo.com']
-        return f"{random.choice(protocols)}://{self.noun(1).lower()}.{random.choice(domains)}"
+        self._buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < self._HEADER.size:
+            raise ValueError("Truncated compiled library.")
+        magic, count, flags = self._HEADER.unpack_from(view)
+        if magic != self.MAGIC:
+            raise ValueError("Not a compiled library.")
+        offsets_end = self._HEADER.size + 4 * (count + 1)
+        if sys.byteorder == "little":
+            offsets = view[self._HEADER.size:offsets_end].cast("I")
+        else:
+            offsets = struct.unpack_from(f"<{count + 1}I", view, self._HEADER.size)
+        data_start = offsets_end
+        self._weights_at = None
+        if flags & self.FLAG_WEIGHTS:
+            self._weights_at = self._weights_offset(count)
+            data_start = self._weights_at + 8 * count
+        self._count = count
+        self._offsets = offsets
+        self._blob = view[data_start:]
 
-    def alphabet(self, length: int) -> str:
+    @classmethod
+    def _weights_offset(cls, count: int) -> int:
+        offsets_end = cls._HEADER.size + 4 * (count + 1)
+        return offsets_end + (-offsets_end % 8)
+
+    @classmethod
+    def open(cls, path: Path) -> "CompiledLibrary":
         """
-        Generates a string of random alphabet characters.
+        Memory-maps a compiled library file.
         
         Args:
-            length (int): The number of letters to generate.
+            path (Path): The path of the compiled library.
         
         Returns:
-            str: A string of random letters separated by spaces.
+            CompiledLibrary: The mapped library.
         """
-        alphabets = LibraryLoader.load_lib("alphabet")
-        return fix_text(" ".join(random.choice(alphabets).lower() for _ in range(length)))
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
 
-    def alphanumeric(self, length: int) -> str:
+    @classmethod
+    def encode(cls, words: List[str], weights: Optional[List[float]] = None) -> bytes:
         """
-        Generates a string of random alphanumeric characters.
+        Serializes words into the compiled format.
         
         Args:
-            length (int): The number of characters to generate.
+            words (List[str]): The entries to store.
+            weights (Optional[List[float]]): Optional sampling weights, one per entry.
         
         Returns:
-            str: A string of random alphanumeric characters.
+            bytes: The compiled library.
         """
-        alphanumerics = LibraryLoader.load_lib("alphabet") + [str(i) for i in range(10)]
-        return fix_text("".join(random.choice(alphanumerics) for _ in range(length)))
+        encoded = [word.encode("utf-8") for word in words]
+        offsets = [0]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        flags = cls.FLAG_WEIGHTS if weights is not None else 0
+        parts = [cls._HEADER.pack(cls.MAGIC, len(encoded), flags), struct.pack(f"<{len(offsets)}I", *offsets)]
+        if weights is not None:
+            pad = cls._weights_offset(len(encoded)) - cls._HEADER.size - 4 * len(offsets)
+            parts += [b"\0" * pad, struct.pack(f"<{len(weights)}d", *weights)]
+        return b"".join(parts + encoded)
 
-    def word(self, length: int) -> str:
+    @classmethod
+    def build(cls, words: List[str], path: Path, weights: Optional[List[float]] = None) -> Path:
         """
-        Generates a string of mixed words (adjectives, adverbs, nouns, verbs).
+        Writes a compiled library atomically.
         
         Args:
-            length (int): The number of words to generate.
+            words (List[str]): The entries to store.
+            path (Path): The destination file.
+            weights (Optional[List[float]]): Optional sampling weights.
         
         Returns:
-            str: A capitalized string of mixed words ending with a period.
+            Path: The written path.
         """
-        adjectives = LibraryLoader.load_lib("adjectives")
-        adverbs = LibraryLoader.load_lib("adverbs")
-        nouns = LibraryLoader.load_lib("nouns")
-        verbs = LibraryLoader.load_lib("verbs")
-        words = adjectives + adverbs + nouns + verbs
-        return cap_text(" ".join(random.choice(words) for _ in range(length)) + ".")
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(cls.encode(words, weights))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
 
-    def address(self) -> str:
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def weighted(self) -> bool:
+        """Whether the library stores sampling weights."""
+        return self._weights_at is not None
+
+    def weight_list(self) -> List[float]:
+        """Decodes the stored sampling weights without NumPy (empty if unweighted)."""
+        if self._weights_at is None:
+            return []
+        return list(struct.unpack_from(f"<{self._count}d", self._buffer, self._weights_at))
+
+    @property
+    def weights(self) -> Optional[np.ndarray]:
+        """The stored sampling weights as a zero-copy float64 view, or None."""
+        if self._weights_at is None:
+            return None
+        return np.frombuffer(self._buffer, dtype='<f8', count=self._count, offset=self._weights_at)
+
+    def raw(self, index: int) -> memoryview:
         """
-        Generates a random address.
+        Returns the UTF-8 bytes of an entry without copying.
+        
+        Args:
+            index (int): The entry index.
         
         Returns:
-            str: A formatted address.
+            memoryview: A view into the mapped blob.
         """
-        street_types = ['St', 'Ave', 'Blvd', 'Rd', 'Lane', 'Drive']
-        return f"{self.number(random.randint(1, 999))} {self.noun(1).title()} {random.choice(street_types)}"
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("library index out of range")
+        return self._blob[self._offsets[index]:self._offsets[index + 1]]
 
-    def company(self) -> str:
+    def __getitem__(self, index: int) -> str:
+        return str(self.raw(index), "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(self._count))
+
+    def tolist(self) -> List[str]:
         """
-        Generates a random company name.
+        Decodes every entry.
         
         Returns:
-            str: A formatted company name.
+            List[str]: The library entries.
         """
-        suffixes = ['Inc', 'LLC', 'Corp', 'Solutions', 'Technologies']
-        return f"{self.noun(1).title()} {random.choice(suffixes)}"
+        blob = bytes(self._blob)
+        offsets = self._offsets
+        return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self._count)]
 
-    def hashtag(self, count: int = 1) -> str:
-        """
-        Generate trending-style hashtags
-        """
-        tags = []
-        for _ in range(count):
-            words = [self.noun(1), self.adjective(1)]
-            random.shuffle(words)
-            tag = ''.join(word.title() for word in ' '.join(words).split())
-            tags.append(f"#{tag}")
-        return ' '.join(tags)
 
-    def emoji(self, count: int = 1) -> str:
+class LibraryView:
+    """
+    A read-only sequence over one or more compiled libraries in one casing.
+
+    Entries are decoded from the mapped blob and cased on first access, then
+    memoized, so a process that draws a few words never decodes the rest.
+    ``tolist`` decodes everything at once for batch sampling.
+    """
+
+    def __init__(self, libs: List[CompiledLibrary], transform: Optional[Callable[[str], str]] = None,
+                 extra: tuple = ()):
         """
-        Generate random emojis
+        Args:
+            libs (List[CompiledLibrary]): The libraries, concatenated in order.
+            transform (Optional[Callable[[str], str]]): The casing applied to each entry.
+            extra (tuple): Additional entries appended after the libraries.
         """
-        emojis = ['😀', '😎', '🔥', '💡', '🚀', '💻', '🎮', '📱', '🎨', '🎯']
-        return ''.join(random.sample(emojis, min(count, len(emojis))))
-    
-    def filename(self, extension: str = None) -> str:
+        self._libs = libs
+        self._transform = transform
+        self._starts = [0]
+        for lib in libs:
+            self._starts.append(self._starts[-1] + len(lib))
+        self._decoded = [None] * self._starts[-1] + [transform(e) if transform else e for e in extra]
+        self._complete = not libs
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def __getitem__(self, index: int) -> str:
+        word = self._decoded[index]
+        if word is None:
+            if index < 0:
+                index += len(self._decoded)
+            which = bisect.bisect_right(self._starts, index) - 1
+            word = self._libs[which][index - self._starts[which]]
+            if self._transform is not None:
+                word = self._transform(word)
+            self._decoded[index] = word
+        return word
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tolist())
+
+    def tolist(self) -> List[str]:
         """
-        Generate random filename
+        Decodes every entry.
+        
+        Returns:
+            List[str]: The entries; the memoized list itself, not a copy.
         """
-        if not extension:
-            extension = random.choice(['.txt', '.pdf', '.doc', '.jpg', '.png'])
-        name = self.alphanumeric(8).lower()
-        return f"{name}{extension}"
+        if not self._complete:
+            transform = self._transform
+            for start, lib in zip(self._starts, self._libs):
+                words = lib.tolist()
+                self._decoded[start:start + len(words)] = [transform(w) for w in words] if transform else words
+            self._complete = True
+        return self._decoded
 
 
-class PhraseGenerator:
+class WordSampler:
     """
-    Generates predefined phrase structures such as Noam, similes, and clichés.
+    Draws word indices uniformly or, when weights are given, in O(1) per
+    draw from a Vose alias table built once up front.
+
+    Samplers built from Python lists keep the words and alias table as lists
+    and only convert them to NumPy arrays on the first batch draw, so scalar
+    callers (``pick``, ``choice``) never import NumPy.
     """
 
-    def noam(self) -> str:
+    def __init__(self, words, weights=None):
         """
-        Generates a Noam-like phrase with adjectives, nouns, verbs, and adverbs.
+        Args:
+            words: The entries to sample, as a list, a ``LibraryView`` or an ``np.ndarray``.
+            weights: Optional non-negative weights, one per entry.
         
-        Returns:
-            str: A formatted Noam phrase.
+        Raises:
+            ValueError: If the weights do not match the words or sum to zero.
         """
-        adjectives = LibraryLoader.load_lib("adjectives")
-        adverbs = LibraryLoader.load_lib("adverbs")
-        nouns = LibraryLoader.load_lib("nouns")
-        verbs = LibraryLoader.load_lib("verbs")
-        val = f'{random.choice(adjectives)} {random.choice(adjectives)} {random.choice(nouns)} {random.choice(verbs)}s {random.choice(adverbs)}.'
-        return cap_text(val)
+        is_array = hasattr(words, 'dtype')
+        self._size = len(words)
+        self._words, self._word_list = (words, None) if is_array else (None, words)
+        self._prob = self._alias = self._lists = self._scalar = None
+        if weights is not None:
+            prob, alias = self._alias_lists(weights)
+            if len(prob) != self._size:
+                raise ValueError("Expected one weight per word.")
+            if is_array:
+                self._prob, self._alias = np.array(prob), np.array(alias, dtype=np.intp)
+            else:
+                self._lists = (prob, alias)
 
-    def simile(self) -> str:
+    @staticmethod
+    def _alias_lists(weights) -> Tuple[List[float], List[int]]:
+        weights = weights.tolist() if hasattr(weights, 'tolist') else list(weights)
+        total = math.fsum(weights)
+        if len(weights) == 0 or total <= 0 or min(weights) < 0:
+            raise ValueError("Weights must be non-negative with a positive sum.")
+        factor = len(weights) / total
+        scaled = [w * factor for w in weights]
+        prob = [1.0] * len(scaled)
+        alias = list(range(len(scaled)))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        return prob, alias
+
+    @staticmethod
+    def alias_table(weights) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generates a simile phrase.
+        Builds a Vose alias table.
+        
+        Args:
+            weights: Non-negative weights.
         
         Returns:
-            str: A formatted simile sentence.
+            Tuple[np.ndarray, np.ndarray]: Acceptance probabilities and alias
+            indices; draw ``i`` uniformly, keep it with probability
+            ``prob[i]``, otherwise take ``alias[i]``.
         """
-        adjectives = LibraryLoader.load_lib("adjectives")
-        nouns = LibraryLoader.load_lib("nouns")
-        val = f'He was as {random.choice(adjectives)} as a {random.choice(nouns)}.'
-        return cap_text(val)
+        prob, alias = WordSampler._alias_lists(weights)
+        return np.array(prob), np.array(alias, dtype=np.intp)
 
-    def cliche(self) -> str:
+    def with_words(self, words) -> "WordSampler":
         """
-        Generates a cliché phrase.
-        
-        Returns:
-            str: A formatted cliché sentence.
+        Returns a sampler over a same-length variant of the words (e.g. a
+        different casing) sharing this sampler's alias table, so equal draws
+        pick corresponding entries.
         """
-        adverbs = LibraryLoader.load_lib("adverbs")
-        verbs = LibraryLoader.load_lib("verbs")
-        val = f'It\'s not rocket science, just {random.choice(adverbs)} {random.choice(verbs)} it.'
-        return cap_text(val)
+        if len(words) != self._size:
+            raise ValueError("Expected one variant per word.")
+        variant = WordSampler.__new__(WordSampler)
+        variant.__dict__.update(self.__dict__)
+        is_array = hasattr(words, 'dtype')
+        variant._words, variant._word_list = (words, None) if is_array else (None, words)
+        variant._scalar = None
+        return variant
 
+    @property
+    def words(self) -> np.ndarray:
+        """The entries as an object array, built on first use."""
+        if self._words is None:
+            words = self._word_list
+            self._words = np.array(words if isinstance(words, list) else words.tolist(), dtype=object)
+        return self._words
 
-class SoupImage:
-    """
-    Generates random grayscale images.
-    """
+    @property
+    def word_list(self) -> Union[List[str], LibraryView]:
+        """The entries as a Python list or library view, for scalar lookups."""
+        if self._word_list is None:
+            self._word_list = self._words.tolist()
+        return self._word_list
+
+    @property
+    def prob(self) -> Optional[np.ndarray]:
+        """The alias-table acceptance probabilities as an array, or None when uniform."""
+        if self._prob is None and self._lists is not None:
+            self._prob = np.array(self._lists[0])
+        return self._prob
+
+    @property
+    def alias(self) -> Optional[np.ndarray]:
+        """The alias-table alias indices as an array, or None when uniform."""
+        if self._alias is None and self._lists is not None:
+            self._alias = np.array(self._lists[1], dtype=np.intp)
+        return self._alias
+
+    def _tables(self) -> tuple:
+        # (words, prob, alias) as lists for the scalar draws; prob and alias are None when uniform.
+        if self._scalar is None:
+            if self._lists is None and self._prob is not None:
+                self._lists = (self._prob.tolist(), self._alias.tolist())
+            self._scalar = (self.word_list, *(self._lists or (None, None)))
+        return self._scalar
 
-    def __init__(self, width: int, height: int, path: str):
+    def indices(self, rng, size) -> np.ndarray:
         """
-        Initializes the SoupImage with dimensions and saves a random grayscale image.
+        Draws entry indices.
         
         Args:
-            width (int): The width of the image.
-            height (int): The height of the image.
-            path (str): The file path to save the image.
+            rng: A ``numpy.random.Generator``.
+            size: The output shape.
+        
+        Returns:
+            np.ndarray: Indices into ``words``.
         """
-        self.width = width
-        self.height = height
-        self.path = Path(path)
-        self.pixels = np.random.randint(0, 256, size=(self.height, self.width), dtype=np.uint8)
-        img = PILImage.fromarray(self.pixels, 'L')
-        img.save(self.path)
-        print(f"Grayscale image saved to {self.path}")
+        picked = rng.integers(0, self._size, size)
+        if self.prob is None:
+            return picked
+        return np.where(rng.random(size) < self.prob[picked], picked, self.alias[picked])
 
-    def show(self):
+    def pick(self, rng, k: int) -> List[int]:
         """
-        Displays the generated image.
+        Draws ``k`` entry indices with the standard library, which is much
+        cheaper than ``indices`` for the handful needed by scalar methods.
+        
+        Args:
+            rng: A ``random.Random``.
+            k (int): The number of indices.
+        
+        Returns:
+            List[int]: Indices into ``words``.
         """
-        img = PILImage.fromarray(self.pixels, 'L')
-        img.show()
+        words, prob, alias = self._tables()
+        n = len(words)
+        if prob is None:
+            return [int(rng.random() * n) for _ in range(k)]
+        picked = []
+        for _ in range(k):
+            i = int(rng.random() * n)
+            picked.append(i if rng.random() < prob[i] else alias[i])
+        return picked
 
+    def choice(self, rng) -> str:
+        """Draws a single entry with a ``random.Random``; see ``pick``."""
+        words, prob, alias = self._scalar or self._tables()
+        i = int(rng.random() * len(words))
+        if prob is not None and rng.random() >= prob[i]:
+            i = alias[i]
+        return words[i]
 
-class SoupImageRGB:
+    def sample(self, rng, size) -> np.ndarray:
+        """Draws entries; see ``indices``."""
+        return self.words[self.indices(rng, size)]
+
+
+class LibraryLoader:
     """
-    Generates random RGB images.
+    Loads and caches word libraries from CSV files.
+
+    Each ``libs/<name>.csv`` is compiled once into ``libs/<name>.souplib``
+    (see ``CompiledLibrary``) and memory-mapped on later loads. The compiled
+    file is rebuilt whenever the CSV is newer or in an older format.
+
+    A CSV row of the form ``word,weight`` (numeric weight) gives the word a
+    sampling weight; other words in a weighted file default to 1. Weighted
+    libraries are sampled through alias tables (``load_sampler``).
+
+    Samplers read words through a ``LibraryView``: scalar draws decode and
+    case only the entries they hit, straight from the mapped blob. Batch
+    draws decode a casing variant once into an object array (``load_array``).
     """
+    lib_dir: Path = LIB_DIR
+    CASES = {'raw': None, 'lower': str.lower, 'title': str.title, 'capitalize': str.capitalize, 'slug': _slug}
+    _cache: dict = {}
+    _view_cache: dict = {}
+    _array_cache: dict = {}
+    _compiled_cache: dict = {}
+    _sampler_cache: dict = {}
 
-    def __init__(self, width: int, height: int, path: str):
+    @staticmethod
+    def parse_csv(path: Path) -> Tuple[List[str], Optional[List[float]]]:
         """
-        Initializes the SoupImageRGB with dimensions and saves a random RGB image.
+        Parses a library CSV file into cleaned entries and optional weights.
         
         Args:
-            width (int): The width of the image.
-            height (int): The height of the image.
-            path (str): The file path to save the image.
+            path (Path): The CSV file.
+        
+        Returns:
+            Tuple[List[str], Optional[List[float]]]: The words, and their
+            weights if any row has a weight column.
         """
-        self.width = width
-        self.height = height
-        self.path = Path(path)
-        self.pixels = np.random.randint(0, 256, size=(self.height, self.width, 3), dtype=np.uint8)
-        img = PILImage.fromarray(self.pixels, 'RGB')
-        img.save(self.path)
-
+        words, weights, weighted = [], [], False
+        with path.open(newline='', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                cells = [cell.strip() for cell in row if cell.strip()]
+                if len(cells) == 2:
+                    try:
+                        weight = float(cells[1])
+                    except ValueError:
+                        pass
+                    else:
+                        words.append(fix_text(cells[0]))
+                        weights.append(weight)
+                        weighted = True
+                        continue
+                words.extend(fix_text(cell) for cell in cells)
+                weights.extend([1.0] * len(cells))
+        return words, weights if weighted else None
 
-class Audio:
-    """
-    Generate various audio content
-    dependencies: numpy
-    """
-    
-    def wav(self, duration=1.0, sample_rate=44100, filepath=None):
+    @staticmethod
+    def compile_lib(filename: str) -> Path:
         """
-        Generate random WAV audio data
+        Compiles a library CSV file into the memory-mappable format.
+        
+        Args:
+            filename (str): The name of the CSV file without extension.
+        
+        Returns:
+            Path: The compiled library path.
+        
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+        """
+        path = LibraryLoader.lib_dir / f'{filename}.csv'
+        if not path.exists():
+            raise FileNotFoundError(f"Library file '{path}' not found.")
+        words, weights = LibraryLoader.parse_csv(path)
+        return CompiledLibrary.build(words, path.with_suffix('.souplib'), weights)
+
+    @staticmethod
+    def compile_all() -> List[Path]:
+        """
+        Compiles every library CSV file in the 'libs' directory.
+        
+        Returns:
+            List[Path]: The compiled library paths.
+        """
+        return [LibraryLoader.compile_lib(p.stem) for p in sorted(LibraryLoader.lib_dir.glob('*.csv'))]
+
+    @staticmethod
+    def load_compiled(filename: str) -> CompiledLibrary:
+        """
+        Loads a library in its compiled, memory-mapped form.
+        
+        The compiled file is (re)built from the CSV when missing or stale. If
+        the 'libs' directory is read-only, the library is compiled in memory.
+        
+        Args:
+            filename (str): The name of the CSV file without extension.
+        
+        Returns:
+            CompiledLibrary: The compiled library.
+        
+        Raises:
+            FileNotFoundError: If neither the CSV nor a compiled file exists.
+        """
+        if filename in LibraryLoader._compiled_cache:
+            return LibraryLoader._compiled_cache[filename]
+
+        path = LibraryLoader.lib_dir / f'{filename}.csv'
+        compiled = path.with_suffix('.souplib')
+        if not path.exists() and not compiled.exists():
+            raise FileNotFoundError(f"Library file '{path}' not found.")
+
+        lib = None
+        if not path.exists() or (compiled.exists() and compiled.stat().st_mtime >= path.stat().st_mtime):
+            try:
+                lib = CompiledLibrary.open(compiled)
+            except ValueError:
+                if not path.exists():
+                    raise
+        if lib is None:
+            try:
+                lib = CompiledLibrary.open(LibraryLoader.compile_lib(filename))
+            except OSError:
+                lib = CompiledLibrary(CompiledLibrary.encode(*LibraryLoader.parse_csv(path)))
+
+        LibraryLoader._compiled_cache[filename] = lib
+        return lib
+
+    @staticmethod
+    def load_lib(filename: str) -> List[str]:
+        """
+        Loads a list of words from a CSV file located in the 'libs' directory.
+        
+        Args:
+            filename (str): The name of the CSV file without extension.
+        
+        Returns:
+            List[str]: A list of words.
+        
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+        """
+        if filename in LibraryLoader._cache:
+            Instrumentation.count('LibraryLoader.load_lib.hit')
+            return LibraryLoader._cache[filename]
+        
+        Instrumentation.count('LibraryLoader.load_lib.miss')
+        lib = LibraryLoader.load_compiled(filename).tolist()
+        
+        LibraryLoader._cache[filename] = lib
+        return lib
+
+    @staticmethod
+    def load_view(*filenames: str, case: str = 'lower', extra: tuple = ()) -> LibraryView:
+        """
+        Loads one or more libraries as a lazily decoded sequence in a casing variant.
+        
+        Args:
+            *filenames (str): The names of the CSV files without extension.
+            case (str): The casing variant, one of ``CASES``.
+            extra (tuple): Additional entries appended after the libraries.
+        
+        Returns:
+            LibraryView: The view over the mapped libraries, built once and cached.
+        
+        Raises:
+            ValueError: If the casing variant is unknown.
+        """
+        key = (filenames, case, extra)
+        if key in LibraryLoader._view_cache:
+            return LibraryLoader._view_cache[key]
+        if case not in LibraryLoader.CASES:
+            raise ValueError(f"Unknown case '{case}'. Choose from {list(LibraryLoader.CASES)}.")
+
+        libs = [LibraryLoader.load_compiled(name) for name in filenames]
+        view = LibraryView(libs, LibraryLoader.CASES[case], extra)
+
+        LibraryLoader._view_cache[key] = view
+        return view
+
+    @staticmethod
+    def load_array(*filenames: str, case: str = 'lower') -> np.ndarray:
+        """
+        Loads one or more libraries as a single NumPy array for batch sampling.
+        
+        Args:
+            *filenames (str): The names of the CSV files without extension.
+            case (str): The casing variant, one of ``CASES``.
+        
+        Returns:
+            np.ndarray: An object array of words, built once and cached.
+        
+        Raises:
+            ValueError: If the casing variant is unknown.
+        """
+        key = (filenames, case)
+        if key not in LibraryLoader._array_cache:
+            LibraryLoader._array_cache[key] = np.array(LibraryLoader.load_view(*filenames, case=case).tolist(),
+                                                       dtype=object)
+        return LibraryLoader._array_cache[key]
+
+    @staticmethod
+    def load_sampler(*filenames: str, case: str = 'lower', extra: tuple = ()) -> WordSampler:
+        """
+        Loads a shared sampler over one or more libraries.
+        
+        Weights from weighted libraries are honoured through an alias table
+        built once here; entries of unweighted libraries and ``extra`` entries
+        get weight 1. Without any weights, sampling is uniform. Every casing
+        variant shares one table, so the same draws yield the same words.
+        
+        Args:
+            *filenames (str): The names of the CSV files without extension.
+            case (str): The casing variant, one of ``CASES``.
+            extra (tuple): Additional unweighted entries (e.g. digits).
+        
+        Returns:
+            WordSampler: The cached sampler.
+        """
+        key = (filenames, case, extra)
+        sampler = LibraryLoader._sampler_cache.get(key)
+        if sampler is not None:
+            return sampler
+
+        words = LibraryLoader.load_view(*filenames, case=case, extra=extra)
+        if case != 'lower':
+            sampler = LibraryLoader.load_sampler(*filenames, extra=extra).with_words(words)
+            LibraryLoader._sampler_cache[key] = sampler
+            return sampler
+        libs = [LibraryLoader.load_compiled(name) for name in filenames]
+        weights = None
+        if any(lib.weighted for lib in libs):
+            weights = [w for lib in libs for w in (lib.weight_list() if lib.weighted else [1.0] * len(lib))]
+            weights += [1.0] * len(extra)
+        sampler = WordSampler(words, weights)
+
+        LibraryLoader._sampler_cache[key] = sampler
+        return sampler
+
+
+class TextGenerator:
+    """
+    Generates various types of text elements such as numbers, nouns, adjectives, etc.
+
+    Every word method has a batch counterpart (``nouns``, ``adjectives``, ...)
+    returning one string per row; the scalar methods are thin wrappers over it.
+    Single-row requests take a stdlib fast path over cached lists instead of
+    building NumPy arrays.
+    """
+
+    _WORD_LIBS = ("adjectives", "adverbs", "nouns", "verbs")
+    _STREET_TYPES = ('St', 'Ave', 'Blvd', 'Rd', 'Lane', 'Drive')
+    _COMPANY_SUFFIXES = ('Inc', 'LLC', 'Corp', 'Solutions', 'Technologies')
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+        """
+        self.rng = SoupRandom.wrap(rng)
+
+    def _sample(self, sampler: WordSampler, n_rows: int, words_per_row, sep: str = " ",
+                lead: Optional[WordSampler] = None) -> List[str]:
+        """
+        Samples ``n_rows`` strings of ``words_per_row`` entries from a library.
+        
+        Args:
+            sampler (WordSampler): The library sampler to draw from.
+            n_rows (int): The number of strings to generate.
+            words_per_row (Union[int, tuple]): The number of words in each
+                string, or an inclusive ``(low, high)`` range drawn per row.
+            sep (str): The separator placed between words.
+            lead (Optional[WordSampler]): A casing variant of ``sampler``
+                used for the first word of each string.
+        
+        Returns:
+            List[str]: The generated strings.
+        """
+        if n_rows == 1:
+            # Scalar fast path: a few stdlib draws over cached lists beat building arrays.
+            py = self.rng.py
+            width = py.randint(*words_per_row) if isinstance(words_per_row, tuple) else words_per_row
+            if width <= 0:
+                return [""]
+            if width == 1 and lead is None:
+                return [sampler.choice(py)]
+            idx = sampler.pick(py, width)
+            words = sampler.word_list
+            picked = [words[i] for i in idx]
+            if lead is not None:
+                picked[0] = lead.word_list[idx[0]]
+            return [sep.join(picked)]
+
+        def pick(width: int) -> np.ndarray:
+            idx = sampler.indices(self.rng.np, (n_rows, width))
+            picked = sampler.words[idx]
+            if lead is not None and width:
+                picked[:, 0] = lead.words[idx[:, 0]]
+            return picked
+
+        if isinstance(words_per_row, tuple):
+            low, high = words_per_row
+            counts = self.rng.np.integers(low, high + 1, n_rows).tolist()
+            picked = pick(high)
+            return [sep.join(row[:k]) for row, k in zip(picked.tolist(), counts)]
+        if words_per_row <= 0:
+            return [""] * n_rows
+        picked = pick(words_per_row)
+        if words_per_row == 1:
+            return picked[:, 0].tolist()
+        return [sep.join(row) for row in picked.tolist()]
+
+    @staticmethod
+    def _char_table(chars: List[str]):
+        """
+        Returns the byte codes of single-character ASCII entries, or None.
+        """
+        joined = "".join(chars)
+        if len(joined) != len(chars) or not joined.isascii():
+            return None
+        return np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+
+    def _char_rows(self, sampler: WordSampler, n_rows: int, length: int) -> List[str]:
+        """
+        Samples ``n_rows`` strings of ``length`` characters without separators.
+        
+        Args:
+            sampler (WordSampler): The characters to draw from.
+            n_rows (int): The number of strings to generate.
+            length (int): The number of characters in each string.
+        
+        Returns:
+            List[str]: The generated strings.
+        """
+        if length <= 0:
+            return [""] * n_rows
+        table = None if n_rows == 1 else self._char_table(sampler.word_list)
+        if table is None:
+            return self._sample(sampler, n_rows, length, sep="")
+        codes = table[sampler.indices(self.rng.np, (n_rows, length))]
+        return codes.view(f"S{length}").ravel().astype(str).tolist()
+
+    def numbers(self, n_rows: int, length: int) -> List[str]:
+        """
+        Generates strings of random digits in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            length (int): The number of digits in each string.
+        
+        Returns:
+            List[str]: Strings of random digits.
+        """
+        return self._char_rows(self._digits(), n_rows, length)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _digits() -> WordSampler:
+        """Returns the shared uniform sampler over the decimal digits."""
+        return WordSampler(list(string.digits))
+
+    def nouns(self, n_rows: int, words_per_row: int = 1, case: str = 'lower') -> List[str]:
+        """
+        Generates strings of random nouns in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            words_per_row (int): The number of nouns in each string.
+            case (str): The casing variant (see ``LibraryLoader.CASES``).
+        
+        Returns:
+            List[str]: Strings of nouns separated by spaces.
+        """
+        return self._sample(LibraryLoader.load_sampler("nouns", case=case), n_rows, words_per_row)
+
+    def adjectives(self, n_rows: int, words_per_row: int = 1, case: str = 'lower') -> List[str]:
+        """
+        Generates strings of random adjectives in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            words_per_row (int): The number of adjectives in each string.
+            case (str): The casing variant (see ``LibraryLoader.CASES``).
+        
+        Returns:
+            List[str]: Strings of adjectives separated by spaces.
+        """
+        return self._sample(LibraryLoader.load_sampler("adjectives", case=case), n_rows, words_per_row)
+
+    def adverbs(self, n_rows: int, words_per_row: int = 1, case: str = 'lower') -> List[str]:
+        """
+        Generates strings of random adverbs in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            words_per_row (int): The number of adverbs in each string.
+            case (str): The casing variant (see ``LibraryLoader.CASES``).
+        
+        Returns:
+            List[str]: Strings of adverbs separated by spaces.
+        """
+        return self._sample(LibraryLoader.load_sampler("adverbs", case=case), n_rows, words_per_row)
+
+    def verbs(self, n_rows: int, words_per_row: int = 1, case: str = 'lower') -> List[str]:
+        """
+        Generates strings of random verbs in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            words_per_row (int): The number of verbs in each string.
+            case (str): The casing variant (see ``LibraryLoader.CASES``).
+        
+        Returns:
+            List[str]: Strings of verbs separated by spaces.
+        """
+        return self._sample(LibraryLoader.load_sampler("verbs", case=case), n_rows, words_per_row)
+
+    def alphabets(self, n_rows: int, words_per_row: int = 1) -> List[str]:
+        """
+        Generates strings of random letters in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            words_per_row (int): The number of letters in each string.
+        
+        Returns:
+            List[str]: Strings of lowercase letters separated by spaces.
+        """
+        return self._sample(LibraryLoader.load_sampler("alphabet"), n_rows, words_per_row)
+
+    def alphanumerics(self, n_rows: int, length: int) -> List[str]:
+        """
+        Generates strings of random alphanumeric characters in bulk.
+        
+        Args:
+            n_rows (int): The number of strings to generate.
+            length (int): The number of characters in each string.
+        
+        Returns:
+            List[str]: Strings of random alphanumeric characters.
+        """
+        return self._char_rows(LibraryLoader.load_sampler("alphabet", case='raw', extra=tuple(string.digits)), n_rows, length)
+
+    def words(self, n_rows: int, words_per_row) -> List[str]:
+        """
+        Generates sentences of mixed words (adjectives, adverbs, nouns, verbs) in bulk.
+        
+        Args:
+            n_rows (int): The number of sentences to generate.
+            words_per_row (Union[int, tuple]): The number of words in each
+                sentence, or an inclusive ``(low, high)`` range drawn per row.
+        
+        Returns:
+            List[str]: Capitalized sentences ending with a period.
+        """
+        rows = self._sample(LibraryLoader.load_sampler(*self._WORD_LIBS), n_rows, words_per_row,
+                            lead=LibraryLoader.load_sampler(*self._WORD_LIBS, case='capitalize'))
+        return [row + "." for row in rows]
+
+    def number(self, length: int) -> str:
+        """
+        Generates a string of random numbers.
+        
+        Args:
+            length (int): The number of digits to generate.
+        
+        Returns:
+            str: A string of random digits.
+        """
+        return self.numbers(1, length)[0]
+
+    def noun(self, length: int) -> str:
+        """
+        Generates a string of random nouns.
+        
+        Args:
+            length (int): The number of nouns to generate.
+        
+        Returns:
+            str: A string of random nouns separated by spaces.
+        """
+        return self.nouns(1, length)[0]
+
+    def adjective(self, length: int) -> str:
+        """
+        Generates a string of random adjectives.
+        
+        Args:
+            length (int): The number of adjectives to generate.
+        
+        Returns:
+            str: A string of random adjectives separated by spaces.
+        """
+        return self.adjectives(1, length)[0]
+
+    def adverb(self, length: int) -> str:
+        """
+        Generates a string of random adverbs.
+        
+        Args:
+            length (int): The number of adverbs to generate.
+        
+        Returns:
+            str: A string of random adverbs separated by spaces.
+        """
+        return self.adverbs(1, length)[0]
+
+    def verb(self, length: int) -> str:
+        """
+        Generates a string of random verbs.
+        
+        Args:
+            length (int): The number of verbs to generate.
+        
+        Returns:
+            str: A string of random verbs separated by spaces.
+        """
+        return self.verbs(1, length)[0]
+
+    def phones(self, n_rows: int) -> List[str]:
+        """
+        Generates random US phone numbers in bulk.
+        
+        Args:
+            n_rows (int): The number of phone numbers to generate.
+        
+        Returns:
+            List[str]: Formatted US phone numbers.
+        """
+        area_codes = self.rng.np.integers(100, 1000, n_rows).tolist()
+        office_codes = self.rng.np.integers(100, 1000, n_rows).tolist()
+        line_numbers = self.rng.np.integers(1000, 10000, n_rows).tolist()
+        return [f"({a}) {c}-{n}" for a, c, n in zip(area_codes, office_codes, line_numbers)]
+
+    def phone(self) -> str:
+        """
+        Generates a random US phone number.
+        
+        Returns:
+            str: A formatted US phone number.
+        """
+        py = self.rng.py
+        return f"({py.randint(100, 999)}) {py.randint(100, 999)}-{py.randint(1000, 9999)}"
+
+    def credit_card(self) -> str:
+        """
+        Generates a random credit card number (for testing only!).
+        
+        Returns:
+            str: A formatted credit card number.
+        """
+        prefix = self.rng.py.choice(['4', '5', '37', '6'])  # Common card prefixes
+        length = 16 if prefix != '37' else 15
+        number = prefix + ''.join([str(self.rng.py.randint(0, 9)) for _ in range(length - len(prefix))])
+        return ' '.join(number[i:i+4] for i in range(0, len(number), 4))
+
+    def url(self) -> str:
+        """
+        Generates a random URL.
+        
+        Returns:
+            str: A formatted URL.
+        """
+        protocols = ['http', 'https']
+        domains = ['example.com', 'test.com', 'demo.com']
+        return f"{self.rng.py.choice(protocols)}://{self.noun(1).lower()}.{self.rng.py.choice(domains)}"
+
+    def alphabet(self, length: int) -> str:
+        """
+        Generates a string of random alphabet characters.
+        
+        Args:
+            length (int): The number of letters to generate.
+        
+        Returns:
+            str: A string of random letters separated by spaces.
+        """
+        return self.alphabets(1, length)[0]
+
+    def alphanumeric(self, length: int) -> str:
+        """
+        Generates a string of random alphanumeric characters.
+        
+        Args:
+            length (int): The number of characters to generate.
+        
+        Returns:
+            str: A string of random alphanumeric characters.
+        """
+        return self.alphanumerics(1, length)[0]
+
+    def word(self, length: int) -> str:
+        """
+        Generates a string of mixed words (adjectives, adverbs, nouns, verbs).
+        
+        Args:
+            length (int): The number of words to generate.
+        
+        Returns:
+            str: A capitalized string of mixed words ending with a period.
+        """
+        return self.words(1, length)[0]
+
+    def addresses(self, n_rows: int) -> List[str]:
+        """
+        Generates random addresses in bulk.
+        
+        Args:
+            n_rows (int): The number of addresses to generate.
+        
+        Returns:
+            List[str]: Formatted addresses.
+        """
+        street_types = np.array(self._STREET_TYPES, dtype=object)
+        house_numbers = self.rng.np.integers(1, 1000, n_rows).tolist()
+        streets = self.nouns(n_rows, case='title')
+        types = street_types[self.rng.np.integers(0, len(street_types), n_rows)].tolist()
+        return [f"{n} {s} {t}" for n, s, t in zip(house_numbers, streets, types)]
+
+    def address(self) -> str:
+        """
+        Generates a random address.
+        
+        Returns:
+            str: A formatted address.
+        """
+        py = self.rng.py
+        street = LibraryLoader.load_sampler("nouns", case='title').choice(py)
+        return f"{py.randint(1, 999)} {street} {py.choice(self._STREET_TYPES)}"
+
+    def companies(self, n_rows: int) -> List[str]:
+        """
+        Generates random company names in bulk.
+        
+        Args:
+            n_rows (int): The number of company names to generate.
+        
+        Returns:
+            List[str]: Formatted company names.
+        """
+        suffixes = np.array(self._COMPANY_SUFFIXES, dtype=object)
+        names = self.nouns(n_rows, case='title')
+        picked = suffixes[self.rng.np.integers(0, len(suffixes), n_rows)].tolist()
+        return [f"{name} {suffix}" for name, suffix in zip(names, picked)]
+
+    def company(self) -> str:
+        """
+        Generates a random company name.
+        
+        Returns:
+            str: A formatted company name.
+        """
+        name = LibraryLoader.load_sampler("nouns", case='title').choice(self.rng.py)
+        return f"{name} {self.rng.py.choice(self._COMPANY_SUFFIXES)}"
+
+    def usernames(self, n_rows: int) -> List[str]:
+        """
+        Generates random usernames in bulk.
+        
+        Args:
+            n_rows (int): The number of usernames to generate.
+        
+        Returns:
+            List[str]: Usernames like ``brave_otter42``; not guaranteed unique.
+        """
+        columns = zip(self.adjectives(n_rows, case='slug'), self.nouns(n_rows, case='slug'),
+                      self.rng.np.integers(0, 100, n_rows).tolist())
+        return [f"{adjective}_{noun}{number}" for adjective, noun, number in columns]
+
+    def username(self) -> str:
+        """
+        Generates a random username.
+        
+        Returns:
+            str: A username.
+        """
+        return self.usernames(1)[0]
+
+    _EMOJIS = ['😀', '😎', '🔥', '💡', '🚀', '💻', '🎮', '📱', '🎨', '🎯']
+
+    def hashtags(self, n_rows: int, count: int = 1) -> List[str]:
+        """
+        Generate rows of trending-style hashtags in bulk
+        """
+        pairs = zip(self.nouns(n_rows * count, case='title'), self.adjectives(n_rows * count, case='title'),
+                    self.rng.np.integers(0, 2, n_rows * count).tolist())
+        tags = ['#' + (a + b if flip else b + a).replace(' ', '') for a, b, flip in pairs]
+        return [' '.join(tags[i:i + count]) for i in range(0, len(tags), count)] if count else [''] * n_rows
+
+    def hashtag(self, count: int = 1) -> str:
+        """
+        Generate trending-style hashtags (scalar rng.py path; see hashtags)
+        """
+        py = self.rng.py
+        nouns = LibraryLoader.load_sampler("nouns", case='title')
+        adjectives = LibraryLoader.load_sampler("adjectives", case='title')
+        tags = []
+        for _ in range(count):
+            a, b = nouns.choice(py), adjectives.choice(py)
+            tags.append('#' + (a + b if py.random() < 0.5 else b + a).replace(' ', ''))
+        return ' '.join(tags)
+
+    def emojis(self, n_rows: int, count: int = 1) -> List[str]:
+        """
+        Generate rows of distinct random emojis in bulk
+        """
+        count = min(count, len(self._EMOJIS))
+        table = np.array(self._EMOJIS, dtype=object)
+        order = np.argsort(self.rng.np.random((n_rows, len(table))), axis=1)[:, :count]
+        return [''.join(row) for row in table[order].tolist()]
+
+    def emoji(self, count: int = 1) -> str:
+        """
+        Generate random distinct emojis (scalar rng.py path; see emojis)
+        """
+        return ''.join(self.rng.py.sample(self._EMOJIS, min(count, len(self._EMOJIS))))
+    
+    def filename(self, extension: str = None) -> str:
+        """
+        Generate random filename
+        """
+        if not extension:
+            extension = self.rng.py.choice(['.txt', '.pdf', '.doc', '.jpg', '.png'])
+        name = self.alphanumeric(8).lower()
+        return f"{name}{extension}"
+
+
+class PhraseGenerator:
+    """
+    Generates predefined phrase structures such as Noam, similes, and clichés.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+        """
+        self.rng = SoupRandom.wrap(rng)
+
+    def _pick(self, filename: str, n_rows: int, case: str = 'lower') -> List[str]:
+        """
+        Draws ``n_rows`` words from a library in the given casing variant.
+        """
+        return LibraryLoader.load_sampler(filename, case=case).sample(self.rng.np, n_rows).tolist()
+
+    def _one(self, filename: str, case: str = 'lower') -> str:
+        """
+        Draws a single word with ``rng.py`` from the library's cached word list, so
+        the scalar methods never import NumPy (see ``WordSampler``).
+        """
+        return LibraryLoader.load_sampler(filename, case=case).choice(self.rng.py)
+
+    def noams(self, n_rows: int) -> List[str]:
+        """
+        Generates Noam-like phrases in bulk.
+        
+        Args:
+            n_rows (int): The number of phrases to generate.
+        
+        Returns:
+            List[str]: Formatted Noam phrases.
+        """
+        columns = zip(self._pick("adjectives", n_rows, case='capitalize'), self._pick("adjectives", n_rows),
+                      self._pick("nouns", n_rows), self._pick("verbs", n_rows),
+                      self._pick("adverbs", n_rows))
+        return [f'{a1} {a2} {noun} {verb}s {adverb}.' for a1, a2, noun, verb, adverb in columns]
+
+    def similes(self, n_rows: int) -> List[str]:
+        """
+        Generates simile phrases in bulk.
+        
+        Args:
+            n_rows (int): The number of phrases to generate.
+        
+        Returns:
+            List[str]: Formatted simile sentences.
+        """
+        columns = zip(self._pick("adjectives", n_rows), self._pick("nouns", n_rows))
+        return [f'He was as {adjective} as a {noun}.' for adjective, noun in columns]
+
+    def cliches(self, n_rows: int) -> List[str]:
+        """
+        Generates cliché phrases in bulk.
+        
+        Args:
+            n_rows (int): The number of phrases to generate.
+        
+        Returns:
+            List[str]: Formatted cliché sentences.
+        """
+        columns = zip(self._pick("adverbs", n_rows), self._pick("verbs", n_rows))
+        return [f'Its not rocket science, just {adverb} {verb} it.' for adverb, verb in columns]
+
+    def noam(self) -> str:
+        """
+        Generates a Noam-like phrase with adjectives, nouns, verbs, and adverbs.
+        
+        Returns:
+            str: A formatted Noam phrase.
+        """
+        one = self._one
+        return (f'{one("adjectives", "capitalize")} {one("adjectives")} {one("nouns")} '
+                f'{one("verbs")}s {one("adverbs")}.')
+
+    def simile(self) -> str:
+        """
+        Generates a simile phrase.
+        
+        Returns:
+            str: A formatted simile sentence.
+        """
+        return f'He was as {self._one("adjectives")} as a {self._one("nouns")}.'
+
+    def cliche(self) -> str:
+        """
+        Generates a cliché phrase.
+        
+        Returns:
+            str: A formatted cliché sentence.
+        """
+        return f'Its not rocket science, just {self._one("adverbs")} {self._one("verbs")} it.'
+
+
+# Image formats: name -> (PIL format, file extension).
+_IMAGE_FORMATS = {
+    'png': ('PNG', '.png'),
+    'jpeg': ('JPEG', '.jpg'),
+    'webp': ('WEBP', '.webp'),
+    'bmp': ('BMP', '.bmp'),
+    'ppm': ('PPM', '.ppm'),
+}
+
+
+def _encode_image(pixels: np.ndarray, format: str, dest, compress_level: int = 6, quality: int = 90):
+    """Encodes pixels into a binary file object; PNG uses ``compress_level``, JPEG/WebP ``quality``."""
+    if format not in _IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format '{format}'. Choose from {list(_IMAGE_FORMATS)}.")
+    fmt = _IMAGE_FORMATS[format][0]
+    options = {'PNG': {'compress_level': compress_level}, 'JPEG': {'quality': quality},
+               'WEBP': {'quality': quality}}.get(fmt, {})
+    PILImage.fromarray(pixels, 'L' if pixels.ndim == 2 else 'RGB').save(dest, fmt, **options)
+
+
+class _PixelImage:
+    """
+    Disk-free access to a generated image's pixels.
+    """
+
+    pixels: Optional[np.ndarray] = None
+
+    def _require_pixels(self) -> np.ndarray:
+        if self.pixels is None:
+            raise ValueError("The image was streamed to disk and has no pixels in memory.")
+        return self.pixels
+
+    def encode(self, format: str = 'png', compress_level: int = 6, quality: int = 90) -> io.BytesIO:
+        """
+        Encodes the image in memory.
+        
+        Args:
+            format (str): One of 'png', 'jpeg', 'webp', 'bmp' or 'ppm'.
+            compress_level (int): PNG zlib level, 0 (fastest) to 9 (smallest).
+            quality (int): JPEG/WebP quality, 1 to 100.
+        
+        Returns:
+            io.BytesIO: The encoded file, rewound to the start.
+        """
+        out = io.BytesIO()
+        _encode_image(self._require_pixels(), format, out, compress_level, quality)
+        out.seek(0)
+        return out
+
+    def buffer(self) -> memoryview:
+        """
+        Exposes the raw pixels without copying.
+        
+        Returns:
+            memoryview: uint8 rows of ``width`` (gray) or ``width * 3`` (RGB) bytes.
+        """
+        return memoryview(self._require_pixels())
+
+
+class SoupImage(_PixelImage):
+    """
+    Generates random grayscale images.
+    """
+
+    def __init__(self, width: int, height: int, path: Optional[str] = None, rng=None, verbose: bool = False):
+        """
+        Initializes the SoupImage with dimensions and saves a random grayscale image.
+        
+        Args:
+            width (int): The width of the image.
+            height (int): The height of the image.
+            path (Optional[str]): The file path to save the image; None keeps
+                it in memory only (see ``encode`` and ``buffer``).
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            verbose (bool): Whether to print the saved path.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.width = width
+        self.height = height
+        self.path = Path(path) if path is not None else None
+        self.pixels = self.rng.np.integers(0, 256, size=(self.height, self.width), dtype=np.uint8)
+        if self.path is None:
+            return
+        with Instrumentation.span('SoupImage.encode', self.path):
+            img = PILImage.fromarray(self.pixels, 'L')
+            img.save(self.path)
+        if verbose:
+            print(f"Grayscale image saved to {self.path}")
+
+    def show(self):
+        """
+        Displays the generated image.
+        """
+        img = PILImage.fromarray(self.pixels, 'L')
+        img.show()
+
+
+class SoupImageRGB(_PixelImage):
+    """
+    Generates random RGB images.
+    """
+
+    def __init__(self, width: int, height: int, path: Optional[str] = None, rng=None):
+        """
+        Initializes the SoupImageRGB with dimensions and saves a random RGB image.
+        
+        Args:
+            width (int): The width of the image.
+            height (int): The height of the image.
+            path (Optional[str]): The file path to save the image; None keeps
+                it in memory only (see ``encode`` and ``buffer``).
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.width = width
+        self.height = height
+        self.path = Path(path) if path is not None else None
+        self.pixels = self.rng.np.integers(0, 256, size=(self.height, self.width, 3), dtype=np.uint8)
+        if self.path is None:
+            return
+        with Instrumentation.span('SoupImageRGB.encode', self.path):
+            img = PILImage.fromarray(self.pixels, 'RGB')
+            img.save(self.path)
+
+
+class _CountingWriter:
+    """Forwards to a binary file object, counting the bytes written through it."""
+
+    def __init__(self, f):
+        self._f = f
+        self.bytes = 0
+
+    def write(self, data) -> int:
+        self.bytes += memoryview(data).nbytes
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+@contextmanager
+def _wav_sink(dest) -> Iterator[Tuple[wave.Wave_write, _CountingWriter]]:
+    """
+    Opens a 16-bit WAV writer on a path or a binary file object (left open).
+    
+    Yields:
+        Tuple[wave.Wave_write, _CountingWriter]: The writer, and the counter of
+        bytes it emits; read ``bytes`` after the block to include the header.
+    """
+    with ExitStack() as stack:
+        f = stack.enter_context(open(dest, 'wb')) if isinstance(dest, (str, os.PathLike)) else dest
+        counter = _CountingWriter(f)
+        with wave.open(counter, 'wb') as wav_file:
+            wav_file.setsampwidth(2)
+            yield wav_file, counter
+
+
+class AudioSynth:
+    """
+    Block-based audio synthesizer with constant memory at any duration.
+
+    Oscillator phases, pink-noise rows and the brown-noise walk are carried
+    from one block to the next, so consecutive blocks join without clicks
+    and the output does not depend on the block size (except for noise,
+    which depends on the RNG draw order).
+    """
+
+    KINDS = ('noise', 'tone', 'chord')
+    COLORS = ('white', 'pink', 'brown')
+    _PINK_ROWS = 16
+    _BROWN_STEP = 0.02
+
+    def __init__(self, kind: str = 'noise', sample_rate: int = 44100, channels: int = 1,
+                 color: str = 'white', frequencies=(440.0,), rng=None):
+        """
+        Args:
+            kind (str): 'noise', 'tone' (channel ``c`` plays
+                ``frequencies[c % len(frequencies)]``) or 'chord' (every
+                channel plays all frequencies together).
+            sample_rate (int): Samples per second.
+            channels (int): The number of output channels.
+            color (str): Noise colour: 'white', 'pink' or 'brown'.
+            frequencies: Oscillator frequencies in Hz.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+        
+        Raises:
+            ValueError: If the kind or colour is unknown.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown audio kind '{kind}'.")
+        if color not in self.COLORS:
+            raise ValueError(f"Unknown noise color '{color}'.")
+        self.kind = kind
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.color = color
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=np.float64))
+        self.rng = SoupRandom.wrap(rng)
+        self.reset()
+
+    def reset(self):
+        """Rewinds the synthesizer state to the first sample."""
+        self._position = 0
+        self._phase = np.zeros(len(self.frequencies))
+        self._pink_index = np.full(self._PINK_ROWS, -1, dtype=np.int64)
+        self._pink_value = np.zeros((self._PINK_ROWS, self.channels))
+        self._walk = np.zeros(self.channels)
+
+    def next_block(self, frames: int) -> np.ndarray:
+        """
+        Synthesizes the next block of samples.
+        
+        Args:
+            frames (int): The number of frames in the block.
+        
+        Returns:
+            np.ndarray: A (frames, channels) float64 array in [-1, 1].
+        """
+        if self.kind == 'noise':
+            block = getattr(self, f'_{self.color}')(frames)
+        else:
+            block = self._oscillators(frames)
+        self._position += frames
+        return block
+
+    def blocks(self, total_frames: int, block_size: int = 65536) -> Iterator[np.ndarray]:
+        """
+        Synthesizes ``total_frames`` frames as consecutive blocks.
+        
+        Yields:
+            np.ndarray: (frames, channels) float64 blocks.
+        """
+        for start in range(0, total_frames, block_size):
+            yield self.next_block(min(block_size, total_frames - start))
+
+    @staticmethod
+    def to_int16(block: np.ndarray) -> np.ndarray:
+        """Converts float samples in [-1, 1] to 16-bit PCM."""
+        return (np.clip(block, -1.0, 1.0) * 32767).astype(np.int16)
+
+    def render(self, total_frames: int, block_size: int = 65536) -> np.ndarray:
+        """
+        Synthesizes ``total_frames`` frames into one 16-bit array.
+        
+        Returns:
+            np.ndarray: int16 samples, shaped (frames,) for mono or
+            (frames, channels) otherwise.
+        """
+        data = np.empty((total_frames, self.channels), dtype=np.int16)
+        for start, block in zip(range(0, total_frames, block_size), self.blocks(total_frames, block_size)):
+            data[start:start + len(block)] = self.to_int16(block)
+        return data[:, 0] if self.channels == 1 else data
+
+    def write(self, dest, total_frames: int, block_size: int = 65536) -> int:
+        """
+        Streams ``total_frames`` frames to a 16-bit WAV file.
+        
+        Args:
+            dest: A file path or a binary file object.
+            total_frames (int): The number of frames to write.
+            block_size (int): The number of frames synthesized at once.
+        
+        Returns:
+            int: The number of frames written.
+        """
+        with Instrumentation.span('AudioSynth.write') as span:
+            with _wav_sink(dest) as (wav_file, written):
+                wav_file.setnchannels(self.channels)
+                wav_file.setframerate(self.sample_rate)
+                wav_file.setnframes(total_frames)
+                for block in self.blocks(total_frames, block_size):
+                    wav_file.writeframesraw(self.to_int16(block).tobytes())
+            span['bytes'] = written.bytes
+        return total_frames
+
+    def _oscillators(self, frames: int) -> np.ndarray:
+        step = 2 * np.pi * self.frequencies / self.sample_rate
+        n = np.arange(frames)[:, None]
+        waves = np.sin(self._phase + step * n)
+        self._phase = (self._phase + step * frames) % (2 * np.pi)
+        if self.kind == 'chord':
+            return np.repeat(waves.mean(axis=1, keepdims=True), self.channels, axis=1)
+        return waves[:, np.arange(self.channels) % len(self.frequencies)]
+
+    def _white(self, frames: int) -> np.ndarray:
+        return self.rng.np.uniform(-1, 1, (frames, self.channels))
+
+    def _pink(self, frames: int) -> np.ndarray:
+        # Voss-McCartney: row k holds a random value for 2**k samples.
+        positions = self._position + np.arange(frames)
+        total = self._white(frames)
+        for k in range(self._PINK_ROWS):
+            index = positions >> k
+            first = index[0]
+            values = self.rng.np.uniform(-1, 1, (index[-1] - first + 1, self.channels))
+            if self._pink_index[k] == first:
+                values[0] = self._pink_value[k]
+            total += values[index - first]
+            self._pink_index[k] = index[-1]
+            self._pink_value[k] = values[-1]
+        return total / np.sqrt(3 * (self._PINK_ROWS + 1))
+
+    def _brown(self, frames: int) -> np.ndarray:
+        # A random walk folded back into [-1, 1] at the edges.
+        walk = self._walk + np.cumsum(self.rng.np.normal(0, self._BROWN_STEP, (frames, self.channels)), axis=0)
+        self._walk = (walk[-1] + 1) % 4 - 1
+        folded = (walk + 1) % 4
+        return np.where(folded > 2, 4 - folded, folded) - 1
+
+
+class Audio:
+    """
+    Generate various audio content
+    dependencies: numpy
+    """
+    
+    def __init__(self, rng=None):
+        self.rng = SoupRandom.wrap(rng)
+
+    def _synth(self, synth: AudioSynth, duration, filepath):
+        frames = int(duration * synth.sample_rate)
+        data = synth.render(frames)
+        if filepath:
+            with Instrumentation.span('Audio.encode') as span:
+                span['bytes'] = self._write_wav(filepath, data, synth.sample_rate)
+        return data
+
+    @staticmethod
+    def _write_wav(dest, data, sample_rate) -> int:
+        # Returns the number of bytes written, header included.
+        with _wav_sink(dest) as (wav_file, written):
+            wav_file.setnchannels(1 if data.ndim == 1 else data.shape[1])
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(memoryview(np.ascontiguousarray(data)).cast('B'))
+        return written.bytes
+
+    @staticmethod
+    def encode(data, sample_rate=44100):
+        """
+        Wrap int16 samples (as returned by wav, tone and chord) in an in-memory WAV file
+        data: (frames,) mono or (frames, channels) int16 array
+        Returns an io.BytesIO rewound to the start. The raw samples already
+        support the buffer protocol: memoryview(data) exposes them without a copy.
+        """
+        out = io.BytesIO()
+        Audio._write_wav(out, data, sample_rate)
+        out.seek(0)
+        return out
+
+    def wav(self, duration=1.0, sample_rate=44100, filepath=None):
+        """
+        Generate random WAV audio data
         duration: length in seconds
         sample_rate: samples per second
-        filepath: optional path to save the WAV file
+        filepath: optional path or binary file object (e.g. io.BytesIO) to save the WAV file
+        """
+        return self._synth(AudioSynth('noise', sample_rate, rng=self.rng), duration, filepath)
+
+    def tone(self, frequency=440, duration=1.0, sample_rate=44100, filepath=None):
+        """
+        Generate a pure tone
+        frequency: in Hz
+        """
+        return self._synth(AudioSynth('tone', sample_rate, frequencies=(frequency,)), duration, filepath)
+
+    def chord(self, frequencies=(261.63, 329.63, 392.0), duration=1.0, sample_rate=44100, filepath=None):
+        """
+        Generate a chord of equally weighted tones
+        frequencies: in Hz (defaults to C major)
+        """
+        return self._synth(AudioSynth('chord', sample_rate, frequencies=frequencies), duration, filepath)
+
+    def stream(self, filepath, duration=1.0, kind='noise', color='white', frequencies=(440.0,),
+               channels=1, sample_rate=44100, block_size=65536):
+        """
+        Synthesize audio block by block straight into a WAV file, in constant memory
+        filepath: path or binary file object (e.g. io.BytesIO for disk-free output)
+        kind: 'noise', 'tone' or 'chord' (see AudioSynth)
+        color: noise colour, 'white', 'pink' or 'brown'
+        block_size: frames synthesized per block
+        Returns the number of frames written.
+        """
+        synth = AudioSynth(kind, sample_rate, channels, color, frequencies, rng=self.rng)
+        return synth.write(filepath, int(duration * sample_rate), block_size)
+
+
+class UniqueIdGenerator:
+    """
+    Collision-free, random-looking fixed-length IDs in O(1) memory.
+
+    The ID at counter ``i`` is ``permute(i)`` written in base
+    ``len(alphabet)``, where ``permute`` is a keyed Feistel network over the
+    smallest even-bit domain covering ``len(alphabet) ** length`` values,
+    cycle-walked back into range. It is a bijection, so distinct counters
+    always give distinct IDs. Workers that share a key only need disjoint
+    counter ranges (``seek``) to stay collision-free across shards.
+    """
+
+    ALPHANUMERIC = string.ascii_letters + string.digits
+    ROUNDS = 6
+
+    def __init__(self, length: int, key: int = 0, alphabet: str = ALPHANUMERIC, start: int = 0):
+        """
+        Args:
+            length (int): The number of characters per ID.
+            key (int): The permutation key; equal keys give equal sequences.
+            alphabet (str): The distinct ASCII characters IDs are built from.
+            start (int): The first counter value.
+        
+        Raises:
+            ValueError: If the alphabet is invalid or the ID space exceeds 2**62.
+        """
+        if len(set(alphabet)) != len(alphabet) or not alphabet.isascii() or len(alphabet) < 2:
+            raise ValueError("Alphabet must contain at least two distinct ASCII characters.")
+        self.length = length
+        self.alphabet = alphabet
+        self.capacity = len(alphabet) ** length
+        if self.capacity > 2 ** 62:
+            raise ValueError(f"ID space {len(alphabet)}**{length} is too large; use a shorter length.")
+        self._half = max(1, ((self.capacity - 1).bit_length() + 1) // 2)
+        self._mask = np.uint64((1 << self._half) - 1)
+        self._keys = np.random.SeedSequence(key).generate_state(self.ROUNDS, np.uint64)
+        self._table = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        self.position = start
+
+    def _feistel(self, x: np.ndarray) -> np.ndarray:
+        half = np.uint64(self._half)
+        left, right = x >> half, x & self._mask
+        for key in self._keys:
+            h = (right ^ key) * np.uint64(0x9E3779B97F4A7C15)
+            h ^= h >> np.uint64(29)
+            h *= np.uint64(0xBF58476D1CE4E5B9)
+            h ^= h >> np.uint64(32)
+            left, right = right, left ^ (h & self._mask)
+        return (left << half) | right
+
+    def permute(self, counters) -> np.ndarray:
+        """
+        Maps counters in ``[0, capacity)`` to distinct values in the same range.
+        
+        Args:
+            counters: An integer array of counters.
+        
+        Returns:
+            np.ndarray: The permuted values as uint64.
+        """
+        x = self._feistel(np.asarray(counters, dtype=np.uint64))
+        outside = x >= np.uint64(self.capacity)
+        while outside.any():
+            x[outside] = self._feistel(x[outside])
+            outside = x >= np.uint64(self.capacity)
+        return x
+
+    def encode(self, values: np.ndarray) -> List[str]:
+        """Writes values as fixed-length strings over the alphabet."""
+        values = values.copy()
+        base = np.uint64(len(self.alphabet))
+        digits = np.empty((len(values), self.length), dtype=np.uint8)
+        for pos in range(self.length - 1, -1, -1):
+            digits[:, pos] = self._table[values % base]
+            values //= base
+        return digits.view(f'S{self.length}').ravel().astype(str).tolist()
+
+    def ids(self, start: int, n: int) -> List[str]:
+        """
+        Returns the IDs for counters ``[start, start + n)`` without moving the position.
+        
+        Raises:
+            OverflowError: If the range runs past the ID space.
+        """
+        if start < 0 or start + n > self.capacity:
+            raise OverflowError(f"Counter range exceeds the {self.capacity} available IDs.")
+        return self.encode(self.permute(np.arange(start, start + n, dtype=np.uint64)))
+
+    def take(self, n: int) -> List[str]:
+        """Returns the next ``n`` IDs and advances the position."""
+        ids = self.ids(self.position, n)
+        self.position += n
+        return ids
+
+    def seek(self, position: int):
+        """Moves the counter, e.g. to the first record of a shard."""
+        self.position = position
+
+
+class RecordBatch(dict):
+    """
+    Columnar records: a dict of column name to a list or NumPy array.
+
+    All columns have the same length. ``rows()`` walks the columns row-wise
+    and hands out the existing column values instead of regenerating them.
+    """
+
+    @property
+    def num_rows(self) -> int:
+        """Number of records in the batch"""
+        return len(next(iter(self.values()))) if self else 0
+
+    def _lists(self) -> List[list]:
+        return [col.tolist() if isinstance(col, np.ndarray) else col for col in self.values()]
+
+    def row(self, index: int) -> dict:
+        """
+        Returns a single record as a dict.
+        
+        Args:
+            index (int): The record index.
+        
+        Returns:
+            dict: The record.
+        """
+        return {name: col[index].item() if isinstance(col, np.ndarray) else col[index]
+                for name, col in self.items()}
+
+    def rows(self) -> Iterator[dict]:
+        """
+        Iterates over the records as dicts.
+        
+        Returns:
+            Iterator[dict]: One dict per record.
+        """
+        names = list(self.keys())
+        return (dict(zip(names, values)) for values in zip(*self._lists()))
+
+    @classmethod
+    def concat(cls, batches: List["RecordBatch"]) -> "RecordBatch":
+        """
+        Concatenates batches with the same columns, in order.
+        
+        Args:
+            batches (List[RecordBatch]): The batches to join.
+        
+        Returns:
+            RecordBatch: The combined batch.
+        """
+        if not batches:
+            return cls()
+        merged = cls()
+        for name, col in batches[0].items():
+            if isinstance(col, np.ndarray):
+                merged[name] = np.concatenate([batch[name] for batch in batches])
+            else:
+                merged[name] = [value for batch in batches for value in batch[name]]
+        return merged
+
+    def to_dicts(self) -> List[dict]:
+        """
+        Converts the batch to a list of records.
+        
+        Returns:
+            List[dict]: One dict per record.
+        """
+        return list(self.rows())
+
+
+class DataGenerator:
+    """
+    Generate structured data
+    """
+    
+    def __init__(self, rng=None, unique_ids=False):
+        """
+        rng: seed or RNG accepted by SoupRandom.wrap
+        unique_ids: draw ids from UniqueIdGenerator so they never repeat. The
+            key comes from the seed entropy, which child streams share, so
+            shards only need to seek person_ids/product_ids to their first row.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+        self.phrase = PhraseGenerator(self.rng)
+        self.unique_ids = unique_ids
+        if unique_ids:
+            self.person_ids = UniqueIdGenerator(8, key=self.rng.entropy)
+            self.product_ids = UniqueIdGenerator(6, key=self.rng.entropy)
+
+    def people(self, n: int) -> RecordBatch:
+        """
+        Generate random person data in bulk, one column per field
+        """
+        return RecordBatch(
+            id=self.person_ids.take(n) if self.unique_ids else self.text.alphanumerics(n, 8),
+            name=self.text.nouns(n, 2, case='title'),
+            age=self.rng.np.integers(18, 81, n),
+            email=[f"{local}@example.com" for local in self.text.alphanumerics(n, 8)],
+            bio=self.phrase.noams(n),
+            phone=self.text.phones(n),
+            address=self.text.addresses(n)
+        )
+
+    def products(self, n: int) -> RecordBatch:
+        """
+        Generate random product data in bulk, one column per field
+        """
+        return RecordBatch(
+            id=self.product_ids.take(n) if self.unique_ids else self.text.alphanumerics(n, 6),
+            name=[f"{adjective} {noun}" for adjective, noun in zip(self.text.adjectives(n), self.text.nouns(n))],
+            price=np.round(self.rng.np.uniform(1.0, 999.99, n), 2),
+            description=self.phrase.noams(n),
+            in_stock=self.rng.np.integers(0, 2, n).astype(bool),
+            company=self.text.companies(n)
+        )
+
+    def person(self):
+        """
+        Generate random person data (same fields as people, drawn with rng.py)
+        """
+        text = self.text
+        return {
+            'id': self.person_ids.take(1)[0] if self.unique_ids else text.alphanumeric(8),
+            'name': text.nouns(1, 2, case='title')[0],
+            'age': self.rng.py.randint(18, 80),
+            'email': f"{text.alphanumeric(8)}@example.com",
+            'bio': self.phrase.noam(),
+            'phone': text.phone(),
+            'address': text.address()
+        }
+
+    def product(self):
+        """
+        Generate random product data (same fields as products, drawn with rng.py)
+        """
+        text = self.text
+        return {
+            'id': self.product_ids.take(1)[0] if self.unique_ids else text.alphanumeric(6),
+            'name': f"{text.adjective(1)} {text.noun(1)}",
+            'price': round(self.rng.py.uniform(1.0, 999.99), 2),
+            'description': self.phrase.noam(),
+            'in_stock': self.rng.py.random() < 0.5,
+            'company': text.company()
+        }
+
+
+class _PNGStreamWriter:
+    """
+    Writes an 8-bit PNG incrementally, one strip of rows at a time.
+
+    Rows use the PNG "Up" filter and are fed through a single zlib stream,
+    so only the current strip and the previous row are held in memory.
+    """
+
+    _COLOR_TYPES = {1: 0, 3: 2}
+
+    def __init__(self, f, width: int, height: int, channels: int = 3, compress_level: int = 6):
+        self._f = f
+        self._width = width
+        self._channels = channels
+        self._prev = np.zeros(width * channels, dtype=np.uint8)
+        self._z = zlib.compressobj(compress_level)
+        f.write(b'\x89PNG\r\n\x1a\n')
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, self._COLOR_TYPES[channels], 0, 0, 0))
+
+    def _chunk(self, tag: bytes, data: bytes):
+        self._f.write(struct.pack('>I', len(data)) + tag + data)
+        self._f.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(tag)) & 0xFFFFFFFF))
+
+    def write_rows(self, rows: np.ndarray):
+        """Appends a (rows, width[, channels]) uint8 strip."""
+        flat = rows.reshape(len(rows), self._width * self._channels)
+        raw = np.empty((len(flat), flat.shape[1] + 1), dtype=np.uint8)
+        raw[:, 0] = 2
+        raw[0, 1:] = flat[0] - self._prev
+        raw[1:, 1:] = flat[1:] - flat[:-1]
+        self._prev = flat[-1].copy()
+        data = self._z.compress(raw.tobytes())
+        if data:
+            self._chunk(b'IDAT', data)
+
+    def close(self):
+        """Flushes the compressor and writes the trailing chunks."""
+        self._chunk(b'IDAT', self._z.flush())
+        self._chunk(b'IEND', b'')
+
+
+class PatternEngine:
+    """
+    Renders procedural RGB patterns with NumPy broadcasting.
+
+    Block colours and palettes are drawn once when the engine is built; noise
+    and noise lattices are drawn per fixed block of rows from a child stream.
+    Any horizontal strip of rows can therefore be rendered on its own and the
+    result does not depend on the strip size.
+    """
+
+    PATTERNS = ('checker', 'gradient', 'noise', 'stripes', 'radial', 'value_noise')
+    STREAM_FORMATS = ('.png', '.ppm')
+    _NOISE_ROWS = 64
+
+    def __init__(self, width: int, height: int, pattern_type: str = 'checker', rng=None,
+                 size: int = 32, angle: float = 0.0, rings: float = 1.0, octaves: int = 4):
+        """
+        Args:
+            width (int): The image width.
+            height (int): The image height.
+            pattern_type (str): One of ``PATTERNS``.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            size (int): Checker block size, stripe width, or noise lattice spacing.
+            angle (float): Stripe angle in degrees.
+            rings (float): Number of colour cycles from the centre of a radial pattern.
+            octaves (int): Number of value-noise octaves.
+        
+        Raises:
+            ValueError: If the pattern type is unknown.
+        """
+        if pattern_type not in self.PATTERNS:
+            raise ValueError(f"Unknown pattern type '{pattern_type}'.")
+        self.width = width
+        self.height = height
+        self.pattern_type = pattern_type
+        self.rng = SoupRandom.wrap(rng)
+        self.size = max(1, int(size))
+        self.angle = angle
+        self.rings = rings
+        self.octaves = max(1, int(octaves))
+        self._x = np.arange(width)
+        self._palette = self.rng.np.integers(0, 256, (2, 3)).astype(np.float32)
+        if pattern_type == 'checker':
+            blocks = (-(-height // self.size), -(-width // self.size), 3)
+            self._colors = self.rng.np.integers(0, 256, blocks, dtype=np.uint8)
+        elif pattern_type == 'value_noise':
+            self._spacings = [max(1, self.size >> octave) for octave in range(self.octaves)]
+
+    def render(self, y0: int = 0, y1: Optional[int] = None) -> np.ndarray:
+        """
+        Renders the rows ``[y0, y1)`` of the image.
+        
+        Args:
+            y0 (int): The first row.
+            y1 (Optional[int]): The end row (exclusive); defaults to the height.
+        
+        Returns:
+            np.ndarray: A (rows, width, 3) uint8 array.
+        """
+        y1 = self.height if y1 is None else min(y1, self.height)
+        y = np.arange(y0, y1)[:, None]
+        return getattr(self, f'_{self.pattern_type}')(y, y0, y1)
+
+    def strips(self, strip_height: int = 256) -> Iterator[np.ndarray]:
+        """
+        Renders the image as consecutive horizontal strips.
+        
+        Args:
+            strip_height (int): The number of rows per strip.
+        
+        Yields:
+            np.ndarray: (rows, width, 3) uint8 strips, top to bottom.
+        """
+        for y0 in range(0, self.height, strip_height):
+            yield self.render(y0, y0 + strip_height)
+
+    def save(self, path, strip_height: int = 256, compress_level: int = 6) -> Path:
+        """
+        Streams the image to a PNG or binary PPM file strip by strip.
+        
+        Args:
+            path: The output path; must end in ``.png`` or ``.ppm``.
+            strip_height (int): The number of rows rendered at once.
+            compress_level (int): The zlib level used for PNG.
+        
+        Returns:
+            Path: The written path.
+        
+        Raises:
+            ValueError: If the format cannot be streamed.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix not in self.STREAM_FORMATS:
+            raise ValueError(f"Cannot stream '{suffix}' images; use one of {self.STREAM_FORMATS}.")
+        with Instrumentation.span('PatternEngine.save', path), open(path, 'wb') as f:
+            if suffix == '.png':
+                writer = _PNGStreamWriter(f, self.width, self.height, 3, compress_level)
+                for strip in self.strips(strip_height):
+                    writer.write_rows(strip)
+                writer.close()
+            else:
+                f.write(f'P6\n{self.width} {self.height}\n255\n'.encode('ascii'))
+                for strip in self.strips(strip_height):
+                    f.write(strip.tobytes())
+        return path
+
+    def _blend(self, t: np.ndarray) -> np.ndarray:
+        """Maps values in [0, 1] onto the two-colour palette."""
+        low, high = self._palette
+        return (low + t[..., None] * (high - low)).astype(np.uint8)
+
+    def _checker(self, y, y0, y1):
+        rows, cols = y // self.size, self._x[None, :] // self.size
+        odd = ((rows + cols) % 2).astype(np.uint8)
+        return self._colors[rows, cols] * odd[..., None]
+
+    def _gradient(self, y, y0, y1):
+        x = self._x[None, :]
+        pattern = np.empty((len(y), self.width, 3), dtype=np.uint8)
+        pattern[..., 0] = 255 * y // self.height
+        pattern[..., 1] = 255 * x // self.width
+        pattern[..., 2] = 255 * (y + x) // (self.height + self.width)
+        return pattern
+
+    def _noise(self, y, y0, y1):
+        blocks = []
+        for block in range(y0 // self._NOISE_ROWS, -(-y1 // self._NOISE_ROWS)):
+            start = block * self._NOISE_ROWS
+            rows = min(self._NOISE_ROWS, self.height - start)
+            noise = self.rng.child(block).np.integers(0, 256, (rows, self.width, 3), dtype=np.uint8)
+            blocks.append(noise[max(0, y0 - start):y1 - start])
+        return np.concatenate(blocks)
+
+    def _stripes(self, y, y0, y1):
+        theta = np.deg2rad(self.angle)
+        position = self._x[None, :] * np.cos(theta) + y * np.sin(theta)
+        band = (np.floor(position / self.size) % 2).astype(np.float32)
+        return self._blend(band)
+
+    def _radial(self, y, y0, y1):
+        cy, cx = (self.height - 1) / 2, (self.width - 1) / 2
+        radius = np.hypot(self._x[None, :] - cx, y - cy) / max(np.hypot(cx, cy), 1)
+        return self._blend(0.5 - 0.5 * np.cos(2 * np.pi * self.rings * radius))
+
+    def _lattice(self, octave: int, r0: int, r1: int) -> np.ndarray:
+        """Returns lattice rows ``[r0, r1)`` of an octave, drawn per block of rows."""
+        cols = self.width // self._spacings[octave] + 2
+        blocks = []
+        for block in range(r0 // self._NOISE_ROWS, -(-r1 // self._NOISE_ROWS)):
+            start = block * self._NOISE_ROWS
+            lattice = self.rng.child(octave).child(block).np.random((self._NOISE_ROWS, cols, 3), dtype=np.float32)
+            blocks.append(lattice[max(0, r0 - start):r1 - start])
+        return np.concatenate(blocks)
+
+    def _value_noise(self, y, y0, y1):
+        total = np.zeros((len(y), self.width, 3), dtype=np.float32)
+        weight, amplitude = 0.0, 1.0
+        for octave, spacing in enumerate(self._spacings):
+            gy, gx = y[:, 0] / spacing, self._x / spacing
+            iy, ix = gy.astype(np.intp), gx.astype(np.intp)
+            fy, fx = gy - iy, gx - ix
+            fy = (fy * fy * (3 - 2 * fy)).astype(np.float32)[:, None, None]
+            fx = (fx * fx * (3 - 2 * fx)).astype(np.float32)[None, :, None]
+            # Interpolate the few lattice rows this strip touches horizontally,
+            # then blend neighbouring rows vertically.
+            first = iy[0]
+            band = self._lattice(octave, first, iy[-1] + 2)
+            rows = band[:, ix] * (1 - fx) + band[:, ix + 1] * fx
+            total += amplitude * (rows[iy - first] * (1 - fy) + rows[iy - first + 1] * fy)
+            weight += amplitude
+            amplitude /= 2
+        return (total / weight * 255).astype(np.uint8)
+
+
+class SoupPattern(SoupImageRGB):
+    """
+    Generate patterned images
+    """
+
+    # Images above this many bytes are streamed strip by strip when possible.
+    STREAM_THRESHOLD = 256 * 1024 * 1024
+
+    def __init__(self, width, height, path=None, pattern_type='checker', rng=None, strip_height=None, **params):
+        """
+        Args:
+            width (int): The width of the image.
+            height (int): The height of the image.
+            path (Optional[str]): The file path to save the image; None keeps
+                it in memory only.
+            pattern_type (str): One of ``PatternEngine.PATTERNS``; anything else renders noise.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            strip_height (Optional[int]): Render and encode this many rows at a
+                time instead of materializing the whole image (PNG/PPM only).
+            **params: Pattern options passed to ``PatternEngine``.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.width = width
+        self.height = height
+        self.path = path
+        if pattern_type not in PatternEngine.PATTERNS:
+            pattern_type = 'noise'
+        self.engine = PatternEngine(width, height, pattern_type, self.rng, **params)
+
+        if path is None:
+            self.pixels = self.engine.render()
+            return
+        streamable = Path(path).suffix.lower() in PatternEngine.STREAM_FORMATS
+        if strip_height is None and streamable and width * height * 3 > self.STREAM_THRESHOLD:
+            strip_height = 256
+        if strip_height and streamable:
+            self.pixels = None
+            self.engine.save(self.path, strip_height)
+        else:
+            self.pixels = self.engine.render()
+            with Instrumentation.span('SoupPattern.encode', self.path):
+                img = PILImage.fromarray(self.pixels, 'RGB')
+                img.save(self.path)
+
+
+class CodeGenerator:
+    """
+    Generate code snippets
+    """
+    
+    def __init__(self, rng=None):
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+
+    def html(self):
+        """
+        Generate random HTML snippet
+        """
+        tags = ['div', 'p', 'span', 'section']
+        classes = [self.text.noun(1), self.text.adjective(1)]
+        tag = self.rng.py.choice(tags)
+        return f'<{tag} class="{"-".join(classes)}">{self.text.word(5)}</{tag}>'
+
+    def sql(self):
+        """
+        Generate random SQL query
+        """
+        tables = ['users', 'products', 'orders']
+        conditions = ['active = 1', 'created_at > NOW()', 'status = "pending"']
+        return f'SELECT * FROM {self.rng.py.choice(tables)} WHERE {self.rng.py.choice(conditions)} LIMIT {self.rng.py.randint(10,100)};'
+
+    def css(self) -> str:
+        """Generate random CSS rule"""
+        properties = {
+            'color': f'#{self.rng.py.randint(0, 0xFFFFFF):06x}',
+            'margin': f'{self.rng.py.randint(0, 30)}px',
+            'padding': f'{self.rng.py.randint(0, 20)}px',
+            'font-size': f'{self.rng.py.randint(12, 24)}px',
+            'border-radius': f'{self.rng.py.randint(0, 10)}px'
+        }
+        
+        selector = f'.{self.text.noun(1)}'
+        props = [f"    {k}: {v};" for k, v in self.rng.py.sample(list(properties.items()), 3)]
+        return f"{selector} {{\n" + "\n".join(props) + "\n}"
+
+    def javascript(self) -> str:
+        """Generate random JavaScript code"""
+        function_name = f"handle{self.text.nouns(1, case='title')[0]}"
+        param = self.text.noun(1)
+        return f"""function {function_name}({param}) {{
+    console.log('Processing {param}...');
+    return {param}.toString().toUpperCase();
+}}"""
+
+
+class TimeGenerator:
+    """
+    Generate time-related content
+    """
+    
+    RESOLUTIONS = ('D', 's', 'ms')
+    ORDERS = (None, 'sorted', 'monotonic')
+
+    def __init__(self, rng=None):
+        self.rng = SoupRandom.wrap(rng)
+
+    @staticmethod
+    def _bounds(start, end, unit):
+        # Integer years are inclusive; any other bound is an exclusive datetime64-compatible value.
+        low = np.datetime64(f"{start:04d}-01-01" if isinstance(start, int) else start, unit)
+        high = np.datetime64(f"{end + 1:04d}-01-01" if isinstance(end, int) else end, unit)
+        if high <= low:
+            raise ValueError("The end of the range must come after its start.")
+        return low, high
+
+    def _draw(self, n, start, end, unit, order):
+        if unit not in self.RESOLUTIONS:
+            raise ValueError(f"Unknown resolution '{unit}'. Choose from {list(self.RESOLUTIONS)}.")
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown order '{order}'. Choose from {list(self.ORDERS)}.")
+        low, high = self._bounds(start, end, unit)
+        span = int((high - low).astype(np.int64))
+        if order == 'monotonic':
+            if n > span:
+                raise ValueError(f"Cannot draw {n} strictly increasing values from a range of {span}.")
+            # Random spacings over the spare room, plus one unit per step.
+            gaps = np.cumsum(self.rng.np.random(n + 1))
+            offsets = (gaps[:n] / gaps[-1] * (span - n)).astype(np.int64) + np.arange(n)
+        else:
+            offsets = self.rng.np.integers(0, span, n)
+            if order == 'sorted':
+                offsets.sort()
+        return low + offsets.astype(f'timedelta64[{unit}]')
+
+    def dates(self, n, start=2000, end=2024, order=None):
+        """
+        Generate random dates in bulk with datetime64 arithmetic
+        n: number of dates
+        start, end: integer years (both inclusive) or dates/ISO strings (end exclusive)
+        order: None (random), 'sorted', or 'monotonic' (strictly increasing)
+        Returns a datetime64[D] array; see isoformat for strings.
+        """
+        return self._draw(n, start, end, 'D', order)
+
+    def timestamps(self, n, start=2000, end=2024, resolution='s', order=None):
+        """
+        Generate random timestamps in bulk with datetime64 arithmetic
+        n: number of timestamps
+        start, end: integer years (both inclusive) or datetimes/ISO strings (end exclusive)
+        resolution: 's' or 'ms' ('D' for whole days)
+        order: None (random), 'sorted', or 'monotonic' (strictly increasing)
+        Returns a datetime64 array at the given resolution; see isoformat for strings.
+        """
+        return self._draw(n, start, end, resolution, order)
+
+    @staticmethod
+    def isoformat(values, sep=' '):
+        """
+        Format a datetime64 array as ISO 8601 strings in one vectorized pass
+        sep: separator between date and time
+        """
+        values = np.asarray(values)
+        text = np.datetime_as_string(values)
+        if sep != 'T' and text.size and np.datetime_data(values.dtype)[0] not in ('Y', 'M', 'W', 'D'):
+            text.view('U1').reshape(text.size, -1)[:, 10] = sep
+        return text.tolist()
+
+    def date(self, start_year=2000, end_year=2024):
+        """
+        Generate random date (both years inclusive) with the stdlib; see dates for bulk
+        """
+        start = datetime.date(start_year, 1, 1)
+        days = (datetime.date(end_year + 1, 1, 1) - start).days
+        return start + datetime.timedelta(days=self.rng.py.randrange(days))
+
+    def timestamp(self, start_year=2000, end_year=2024):
+        """
+        Generate random timestamp string (second resolution) with the stdlib; see timestamps for bulk
+        """
+        start = datetime.datetime(start_year, 1, 1)
+        seconds = int((datetime.datetime(end_year + 1, 1, 1) - start).total_seconds())
+        return (start + datetime.timedelta(seconds=self.rng.py.randrange(seconds))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class SocialMediaGenerator:
+    """Generate social media style content"""
+    
+    def __init__(self, rng=None):
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+        self.phrase = PhraseGenerator(self.rng)
+
+    def tweets(self, n: int) -> List[str]:
+        """Generate tweet-like messages in bulk"""
+        parts = zip(self.phrase.noams(n), self.text.hashtags(n, 2), self.text.emojis(n, 1))
+        return [f"{content} {hashtags} {emoji}" for content, hashtags, emoji in parts]
+
+    def tweet(self) -> str:
+        """Generate a tweet-like message (scalar rng.py path; see tweets)"""
+        return f"{self.phrase.noam()} {self.text.hashtag(2)} {self.text.emoji(1)}"
+    
+    def comment(self) -> str:
+        """Generate a social media comment"""
+        patterns = [
+            lambda: f"{self.text.emoji(1)} {self.text.word(self.rng.py.randint(3,8))}",
+            lambda: f"This is {self.text.adjective(1)}! {self.text.emoji(2)}",
+            lambda: f"{self.text.hashtag(1)} {self.text.emoji(1)}"
+        ]
+        return self.rng.py.choice(patterns)()
+
+    def username_with_handle(self) -> str:
+        """Generate username with handle"""
+        return f"@{self.text.username()}"
+
+    def graph(self, users: int, **options) -> "SocialGraph":
+        """Build a follower graph of ``users`` users sharing this generator's seed (see SocialGraph)"""
+        return SocialGraph(users, self.rng, **options)
+
+
+class SocialGraph:
+    """
+    A follower graph with power-law popularity, plus posts and reply trees.
+
+    Each user has a popularity weight drawn from a Pareto distribution, and
+    follow targets are drawn in proportion to it through an alias table, so
+    follower counts follow a power law with tail ``exponent``. The graph is
+    stored CSR-style: the accounts user ``u`` follows are
+    ``indices[indptr[u]:indptr[u + 1]]`` (sorted, without duplicates or self
+    follows). Handles are a pure function of the user id and are unique.
+    Users, follows and posts stream to JSONL in batches.
+    """
+
+    # Replies pick their parent among at most this many preceding posts.
+    REPLY_WINDOW = 10000
+
+    def __init__(self, users: int, rng=None, mean_following: float = 20.0, exponent: float = 2.1,
+                 max_following: int = 5000, max_follower_share: float = 0.05, chunk_size: int = 100000):
+        """
+        Args:
+            users (int): The number of users.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            mean_following (float): The mean number of accounts a user follows.
+            exponent (float): The power-law exponent of follower counts (> 1).
+            max_following (int): The cap on accounts followed per user.
+            max_follower_share (float): The largest expected share of all
+                users following a single account; popularity is clipped so
+                the heaviest tail stays plausible for small graphs.
+            chunk_size (int): Users whose follows are drawn at once; the graph
+                is reproducible for a given seed and chunk size.
+        
+        Raises:
+            ValueError: If there are fewer than two users or the exponent is not above 1.
+        """
+        if users < 2:
+            raise ValueError("A social graph needs at least two users.")
+        if exponent <= 1:
+            raise ValueError("The power-law exponent must be greater than 1.")
+        self.rng = SoupRandom.wrap(rng)
+        self.users = users
+        self._handle_ids = UniqueIdGenerator(max(4, math.ceil(math.log(users, 36))), key=self.rng.entropy,
+                                             alphabet=string.ascii_lowercase + string.digits)
+        graph_rng = self.rng.child(0)
+        self.popularity = self._clip(graph_rng.child(0).np.pareto(exponent - 1, users) + 1,
+                                     max_follower_share / mean_following)
+        self._targets = WordSampler(np.arange(users), self.popularity)
+        with Instrumentation.span('SocialGraph.build'):
+            self.indptr, self.indices = self._build(graph_rng, mean_following, min(max_following, users - 1),
+                                                    chunk_size)
+        self._followers = None
+
+    @staticmethod
+    def _clip(weights: np.ndarray, share: float) -> np.ndarray:
+        # Fixed point of cap = share * sum(min(weights, cap)), so no weight exceeds that share of the total.
+        cap = weights.max()
+        for _ in range(50):
+            new_cap = share * np.minimum(weights, cap).sum()
+            if new_cap >= cap:
+                break
+            cap = new_cap
+        return np.minimum(weights, cap)
+
+    def _build(self, rng: SoupRandom, mean: float, cap: int, chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        counts, chunks = [], []
+        for chunk, start in enumerate(range(0, self.users, chunk_size)):
+            size = min(chunk_size, self.users - start)
+            draw = rng.child(chunk + 1).np
+            degree = np.minimum(draw.geometric(1 / mean, size), cap)
+            sources = np.repeat(np.arange(size, dtype=np.int64), degree)
+            targets = self._targets.indices(draw, len(sources)).astype(np.int64)
+            keep = targets != sources + start
+            keys = np.unique(sources[keep] * self.users + targets[keep])
+            counts.append(np.bincount(keys // self.users, minlength=size))
+            chunks.append((keys % self.users).astype(np.int32))
+        indptr = np.zeros(self.users + 1, dtype=np.int64)
+        np.cumsum(np.concatenate(counts), out=indptr[1:])
+        return indptr, np.concatenate(chunks)
+
+    @property
+    def edges(self) -> int:
+        """The number of follow relations"""
+        return len(self.indices)
+
+    def following(self, user: int) -> np.ndarray:
+        """The sorted ids of the accounts ``user`` follows (a view)"""
+        return self.indices[self.indptr[user]:self.indptr[user + 1]]
+
+    def following_counts(self) -> np.ndarray:
+        """The number of accounts each user follows"""
+        return np.diff(self.indptr)
+
+    def follower_counts(self) -> np.ndarray:
+        """The number of followers of each user"""
+        if self._followers is None:
+            self._followers = np.bincount(self.indices, minlength=self.users)
+        return self._followers
+
+    @staticmethod
+    def _mix(values: np.ndarray, key: int) -> np.ndarray:
+        # SplitMix64 finalizer: a fixed pseudo-random function of (value, key).
+        x = values.astype(np.uint64) + np.uint64(key & 0xFFFFFFFFFFFFFFFF) * np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+    def handles(self, ids) -> List[str]:
+        """
+        Returns the handles of the given users.
+        
+        Args:
+            ids: User ids in ``[0, users)``.
+        
+        Returns:
+            List[str]: Handles like ``brave_otter_k3x9``; distinct ids give
+            distinct handles.
+        """
+        ids = np.asarray(ids, dtype=np.uint64)
+        adjectives = LibraryLoader.load_array('adjectives', case='slug')
+        nouns = LibraryLoader.load_array('nouns', case='slug')
+        mixed = self._mix(ids, self.rng.entropy)
+        picked_adjectives = adjectives[(mixed % np.uint64(len(adjectives))).astype(np.int64)]
+        picked_nouns = nouns[((mixed >> np.uint64(32)) % np.uint64(len(nouns))).astype(np.int64)]
+        suffixes = self._handle_ids.encode(self._handle_ids.permute(ids))
+        return [f"{a}_{n}_{s}" for a, n, s in zip(picked_adjectives.tolist(), picked_nouns.tolist(), suffixes)]
+
+    def user_batches(self, batch_size: int = 50000) -> Iterator[RecordBatch]:
+        """
+        Yields user profiles in id order.
+        
+        Args:
+            batch_size (int): Users per batch.
+        
+        Yields:
+            RecordBatch: id, handle, name, bio, following and followers columns.
+        """
+        followers = self.follower_counts()
+        following = self.following_counts()
+        for start in range(0, self.users, batch_size):
+            stop = min(start + batch_size, self.users)
+            text = TextGenerator(self.rng.child(3).child(start))
+            yield RecordBatch(
+                id=np.arange(start, stop),
+                handle=self.handles(np.arange(start, stop)),
+                name=text.nouns(stop - start, 2, case='title'),
+                bio=PhraseGenerator(text.rng).noams(stop - start),
+                following=following[start:stop],
+                followers=followers[start:stop],
+            )
+
+    def post_batches(self, n: int, batch_size: int = 50000, reply_ratio: float = 0.4,
+                     rate: float = 100.0, start: datetime.datetime = datetime.datetime(2024, 1, 1)
+                     ) -> Iterator[RecordBatch]:
+        """
+        Yields ``n`` posts in time order, threaded into reply trees.
+        
+        Authors are drawn by popularity. A reply answers one of the recent
+        posts (``REPLY_WINDOW``) and is written by someone the parent's author
+        follows, mentioning the parent's handle.
+        
+        Args:
+            n (int): The number of posts.
+            batch_size (int): Posts per batch.
+            reply_ratio (float): The probability that a post is a reply.
+            rate (float): Mean posts per simulated second.
+            start (datetime.datetime): The simulated time of the first post.
+        
+        Yields:
+            RecordBatch: id, user_id, handle, parent_id, root_id, created_at
+            and text columns; ``parent_id`` is None for thread roots.
+        """
+        rng = self.rng.child(1)
+        clock = np.datetime64(start, 'ms')
+        recent_authors, recent_roots = [], []
+        for batch, first in enumerate(range(0, n, batch_size)):
+            count = min(batch_size, n - first)
+            draw = rng.child(batch).np
+            authors = self._targets.indices(draw, count).tolist()
+            replies = (draw.random(count) < reply_ratio).tolist()
+            distances = np.minimum(draw.geometric(0.01, count), self.REPLY_WINDOW).tolist()
+            picks = draw.random(count).tolist()
+
+            # Replies depend on their (possibly same-batch) parents, so they are threaded in order.
+            offset = first - len(recent_authors)
+            history_authors, history_roots = recent_authors, recent_roots
+            parents, roots = [], []
+            for i in range(count):
+                post = first + i
+                parent = post - distances[i]
+                if replies[i] and parent >= max(0, offset):
+                    parent_author = history_authors[parent - offset]
+                    lo, hi = self.indptr[parent_author], self.indptr[parent_author + 1]
+                    if hi > lo:
+                        authors[i] = int(self.indices[lo + int(picks[i] * (hi - lo))])
+                    parents.append(parent)
+                    roots.append(history_roots[parent - offset])
+                else:
+                    parents.append(None)
+                    roots.append(post)
+                history_authors.append(authors[i])
+                history_roots.append(roots[-1])
+            recent_authors = history_authors[-self.REPLY_WINDOW:]
+            recent_roots = history_roots[-self.REPLY_WINDOW:]
+
+            stamps = clock + np.cumsum(draw.exponential(1000 / rate, count)).astype('timedelta64[ms]')
+            clock = stamps[-1]
+            handles = self.handles(authors)
+            mentioned = [history_authors[p - offset] if p is not None else 0 for p in parents]
+            mention_handles = self.handles(mentioned)
+            text = TextGenerator(rng.child(batch).child(0))
+            tweets = SocialMediaGenerator(text.rng).tweets(count)
+            comments = text.words(count, (3, 8))
+            yield RecordBatch(
+                id=np.arange(first, first + count),
+                user_id=authors,
+                handle=handles,
+                parent_id=parents,
+                root_id=roots,
+                created_at=TimeGenerator.isoformat(stamps),
+                text=[f"@{mention} {comment}" if parent is not None else tweet
+                      for parent, mention, comment, tweet in zip(parents, mention_handles, comments, tweets)],
+            )
+
+    def write_users(self, dest, batch_size: int = 50000) -> int:
+        """
+        Streams user profiles to JSONL.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            batch_size (int): Users per batch.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            for batch in self.user_batches(batch_size):
+                written += write(Schema.jsonl_chunk(batch))
+        return written
+
+    def write_follows(self, dest, batch_size: int = 50000) -> int:
+        """
+        Streams the adjacency lists to JSONL, one ``{"user_id", "following"}`` line per user.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            batch_size (int): Users per batch.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            for start in range(0, self.users, batch_size):
+                stop = min(start + batch_size, self.users)
+                bounds = self.indptr[start:stop + 1].tolist()
+                flat = self.indices[bounds[0]:bounds[-1]].tolist()
+                base = bounds[0]
+                written += write(''.join(
+                    f'{{"user_id": {user}, "following": {flat[lo - base:hi - base]}}}\n'
+                    for user, lo, hi in zip(range(start, stop), bounds, bounds[1:])))
+        return written
+
+    def write_posts(self, dest, n: int, batch_size: int = 50000, **options) -> int:
+        """
+        Streams ``n`` posts to JSONL.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            n (int): The number of posts.
+            batch_size (int): Posts per batch.
+            **options: Passed to ``post_batches``.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            for batch in self.post_batches(n, batch_size, **options):
+                written += write(Schema.jsonl_chunk(batch))
+        return written
+
+
+class FileGenerator:
+    """Generate various file contents"""
+    
+    def __init__(self, rng=None, unique_ids=False):
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+        self.data = DataGenerator(self.rng, unique_ids)
+        self.unique_ids = unique_ids
+        if unique_ids:
+            self.csv_ids = UniqueIdGenerator(6, key=self.rng.entropy)
+
+    csv_headers = ['id', 'name', 'email', 'status']
+
+    def csv_rows(self, rows: int) -> List[str]:
+        """Generate CSV data lines (without header) in bulk"""
+        statuses = np.array(['active', 'pending', 'inactive'], dtype=object)
+        columns = zip(
+            self.csv_ids.take(rows) if self.unique_ids else self.text.alphanumerics(rows, 6),
+            self.text.nouns(rows, 2),
+            self.text.alphanumerics(rows, 8),
+            statuses[self.rng.np.integers(0, len(statuses), rows)].tolist()
+        )
+        return [f"{id_},{name},{local}@example.com,{status}" for id_, name, local, status in columns]
+
+    def csv_data(self, rows: int = 5) -> str:
+        """Generate CSV content"""
+        return '\n'.join([','.join(self.csv_headers)] + self.csv_rows(rows))
+
+    def write_csv(self, dest, rows: int, chunk_size: int = 50000) -> int:
+        """
+        Stream CSV content to a file in constant memory
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            rows (int): The number of data rows to write.
+            chunk_size (int): The number of rows generated and written at once.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            written += write(','.join(self.csv_headers) + '\n')
+            for start in range(0, rows, chunk_size):
+                lines = self.csv_rows(min(chunk_size, rows - start))
+                written += write('\n'.join(lines) + '\n')
+        return written
+
+    log_levels = ['INFO', 'WARNING', 'ERROR', 'DEBUG']
+
+    def log_entries(self, n: int) -> List[str]:
+        """Generate log file entries in bulk, stamped with the current time"""
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        levels = np.array(self.log_levels, dtype=object)[self.rng.np.integers(0, len(self.log_levels), n)].tolist()
+        return [f"{timestamp} [{level}] {message}" for level, message in zip(levels, self.text.words(n, (5, 10)))]
+
+    def log_entry(self) -> str:
+        """Generate a log file entry"""
+        return self.log_entries(1)[0]
+
+    def config_ini(self) -> str:
+        """Generate INI configuration file content"""
+        sections = {
+            'database': {
+                'host': 'localhost',
+                'port': str(self.rng.py.randint(3000, 9999)),
+                'username': self.text.username(),
+                'password': self.text.alphanumeric(12)
+            },
+            'api': {
+                'key': self.text.alphanumeric(32),
+                'timeout': str(self.rng.py.randint(30, 300)),
+                'retry_limit': str(self.rng.py.randint(1, 5))
+            }
+        }
+        
+        content = []
+        for section, values in sections.items():
+            content.append(f"[{section}]")
+            content.extend(f"{k} = {v}" for k, v in values.items())
+            content.append("")
+        
+        return '\n'.join(content)
+
+
+class DatabaseGenerator:
+    """
+    Builds SQLite fixture databases of users, products and orders.
+
+    Rows come from ``DataGenerator`` batches and are loaded with
+    ``executemany`` inside one transaction per table; indexes are created
+    after the data is in. Orders only reference existing users and products
+    and copy the product's price, so joins and totals are consistent. The
+    output is reproducible for a given seed and ``batch_size``.
+    """
+
+    TABLES = {
+        'users': ('id INTEGER PRIMARY KEY', 'name TEXT NOT NULL', 'age INTEGER NOT NULL',
+                  'email TEXT NOT NULL', 'phone TEXT', 'address TEXT', 'bio TEXT'),
+        'products': ('id INTEGER PRIMARY KEY', 'name TEXT NOT NULL', 'price REAL NOT NULL',
+                     'description TEXT', 'in_stock INTEGER NOT NULL', 'company TEXT'),
+        'orders': ('id INTEGER PRIMARY KEY', 'user_id INTEGER NOT NULL REFERENCES users(id)',
+                   'product_id INTEGER NOT NULL REFERENCES products(id)', 'quantity INTEGER NOT NULL',
+                   'unit_price REAL NOT NULL', 'total REAL NOT NULL', 'created_at TEXT NOT NULL'),
+    }
+    INDEXES = (
+        'CREATE INDEX idx_users_email ON users(email)',
+        'CREATE INDEX idx_orders_user ON orders(user_id)',
+        'CREATE INDEX idx_orders_product ON orders(product_id)',
+        'CREATE INDEX idx_orders_created ON orders(created_at)',
+    )
+    # Orders are placed within this many seconds before ``epoch``.
+    ORDER_WINDOW = 365 * 24 * 3600
+
+    def __init__(self, rng=None, batch_size: int = 10000,
+                 epoch: datetime.datetime = datetime.datetime(2024, 1, 1)):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            batch_size (int): Rows generated and passed to ``executemany`` at once.
+            epoch (datetime.datetime): The latest order timestamp.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.batch_size = batch_size
+        self.epoch = epoch
+
+    def _insert(self, conn, table: str, batches: Iterator[list]) -> int:
+        placeholders = ', '.join('?' * len(self.TABLES[table]))
+        count = 0
+        with Instrumentation.span(f'DatabaseGenerator.{table}'), conn:
+            for rows in batches:
+                conn.executemany(f'INSERT INTO {table} VALUES ({placeholders})', rows)
+                count += len(rows)
+        return count
+
+    def _batches(self, n: int) -> Iterator[tuple]:
+        for start in range(0, n, self.batch_size):
+            yield start, min(self.batch_size, n - start)
+
+    def _user_rows(self, n: int) -> Iterator[list]:
+        data = DataGenerator(self.rng.child(0))
+        for start, count in self._batches(n):
+            batch = data.people(count)
+            ids = range(start + 1, start + count + 1)
+            yield list(zip(ids, batch['name'], batch['age'].tolist(), batch['email'], batch['phone'],
+                           batch['address'], batch['bio']))
+
+    def _product_rows(self, n: int, prices: np.ndarray) -> Iterator[list]:
+        data = DataGenerator(self.rng.child(1))
+        for start, count in self._batches(n):
+            batch = data.products(count)
+            prices[start:start + count] = batch['price']
+            ids = range(start + 1, start + count + 1)
+            yield list(zip(ids, batch['name'], batch['price'].tolist(), batch['description'],
+                           batch['in_stock'].astype(int).tolist(), batch['company']))
+
+    def _order_rows(self, n: int, users: int, prices: np.ndarray) -> Iterator[list]:
+        rng = self.rng.child(2).np
+        epoch = np.datetime64(self.epoch, 's')
+        for start, count in self._batches(n):
+            user_ids = rng.integers(1, users + 1, count)
+            product_ids = rng.integers(1, len(prices) + 1, count)
+            quantity = rng.integers(1, 6, count)
+            unit_price = prices[product_ids - 1]
+            total = np.round(unit_price * quantity, 2)
+            created = epoch - rng.integers(0, self.ORDER_WINDOW, count).astype('timedelta64[s]')
+            ids = range(start + 1, start + count + 1)
+            yield list(zip(ids, user_ids.tolist(), product_ids.tolist(), quantity.tolist(),
+                           unit_price.tolist(), total.tolist(),
+                           np.datetime_as_string(created, unit='s').tolist()))
+
+    def populate(self, conn, users: int = 1000, products: int = 200, orders: int = 5000,
+                 indexes: bool = True) -> dict:
+        """
+        Creates the fixture tables on an open connection and fills them.
+        
+        Args:
+            conn (sqlite3.Connection): The target database; the tables must not exist yet.
+            users (int): The number of users.
+            products (int): The number of products.
+            orders (int): The number of orders.
+            indexes (bool): Whether to create ``INDEXES`` after loading.
+        
+        Returns:
+            dict: Row counts per table.
+        
+        Raises:
+            ValueError: If orders are requested without users or products.
+        """
+        if orders and not (users and products):
+            raise ValueError("Orders need at least one user and one product.")
+        with conn:
+            for table, columns in self.TABLES.items():
+                conn.execute(f'CREATE TABLE {table} ({", ".join(columns)})')
+        prices = np.empty(products)
+        counts = {
+            'users': self._insert(conn, 'users', self._user_rows(users)),
+            'products': self._insert(conn, 'products', self._product_rows(products, prices)),
+            'orders': self._insert(conn, 'orders', self._order_rows(orders, users, prices)),
+        }
+        if indexes:
+            with Instrumentation.span('DatabaseGenerator.indexes'), conn:
+                for statement in self.INDEXES:
+                    conn.execute(statement)
+        return counts
+
+    def build(self, path, users: int = 1000, products: int = 200, orders: int = 5000,
+              indexes: bool = True) -> dict:
+        """
+        Writes a fixture database file, replacing any existing one atomically.
+        
+        The database is loaded with journaling and syncing disabled, which is
+        safe because it is built in a temporary file and only moved into
+        place once complete.
+        
+        Args:
+            path: The database file path.
+            users (int): The number of users.
+            products (int): The number of products.
+            orders (int): The number of orders.
+            indexes (bool): Whether to create ``INDEXES`` after loading.
+        
+        Returns:
+            dict: Row counts per table.
+        """
+        import sqlite3
+
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp)
+            try:
+                conn.execute('PRAGMA journal_mode = OFF')
+                conn.execute('PRAGMA synchronous = OFF')
+                counts = self.populate(conn, users, products, orders, indexes)
+            finally:
+                conn.close()
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return counts
+
+
+class LogStream:
+    """
+    High-rate synthetic log lines on a simulated, monotonic clock.
+
+    Event gaps follow ``distribution`` at ``rate`` events per second.
+    Timestamps are formatted incrementally: each distinct second is
+    rendered once and milliseconds come from a lookup table. Messages are
+    drawn from a pre-generated pool, so producing a line is indexing and
+    concatenation. Lines look like ``FileGenerator.log_entries`` output.
+    """
+
+    DISTRIBUTIONS = ('constant', 'poisson', 'bursty')
+    # Gamma shape for 'bursty' gaps: same mean as 'poisson', much higher variance.
+    _BURST_SHAPE = 0.2
+    _MILLIS = [f".{ms:03d}" for ms in range(1000)]
+
+    def __init__(self, rng=None, rate: float = 1000.0, distribution: str = 'poisson',
+                 start: datetime.datetime = datetime.datetime(2024, 1, 1),
+                 levels=('INFO', 'WARNING', 'ERROR', 'DEBUG'), level_weights=(70, 15, 5, 10),
+                 pool: int = 4096):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            rate (float): Mean events per simulated second.
+            distribution (str): One of ``DISTRIBUTIONS``.
+            start (datetime.datetime): The simulated time of the first event.
+            levels: The log levels.
+            level_weights: Relative frequency of each level.
+            pool (int): The number of distinct messages; 0 generates a fresh
+                message for every line.
+        
+        Raises:
+            ValueError: If the rate or distribution is invalid.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{distribution}'. Choose from {list(self.DISTRIBUTIONS)}.")
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+        self.rate = rate
+        self.distribution = distribution
+        self.levels = WordSampler(np.array(levels, dtype=object), level_weights)
+        self.pool = np.array(self.text.words(pool, (5, 10)), dtype=object) if pool else None
+        self._clock = int(start.replace(tzinfo=datetime.timezone.utc).timestamp() * 1_000_000)
+        self._second = None
+        self._second_text = ''
+
+    def timestamps(self, n: int, span: Optional[float] = None) -> np.ndarray:
+        """
+        Advances the simulated clock by ``n`` events.
+        
+        Args:
+            n (int): The number of events.
+            span (Optional[float]): If given, the gaps are rescaled so the ``n`` events fill exactly
+                ``span`` seconds; the clock then ends at ``start + span``. Used by sharded jobs so that
+                consecutive shards never overlap.
+        
+        Returns:
+            np.ndarray: Non-decreasing int64 UTC timestamps in microseconds.
+        """
+        mean = 1_000_000 / self.rate
+        if self.distribution == 'constant':
+            gaps = np.full(n, mean)
+        elif self.distribution == 'poisson':
+            gaps = self.rng.np.exponential(mean, n)
+        else:
+            gaps = self.rng.np.gamma(self._BURST_SHAPE, mean / self._BURST_SHAPE, n)
+        offsets = np.cumsum(gaps)
+        if span is not None and n:
+            offsets *= span * 1_000_000 / offsets[-1]
+        stamps = self._clock + offsets.astype(np.int64)
+        if n:
+            self._clock = int(stamps[-1])
+        return stamps
+
+    def format_timestamps(self, stamps: np.ndarray) -> List[str]:
+        """
+        Formats sorted microsecond timestamps as ``YYYY-MM-DD HH:MM:SS.mmm``.
+        
+        Args:
+            stamps (np.ndarray): Non-decreasing int64 microsecond timestamps.
+        
+        Returns:
+            List[str]: The formatted timestamps.
+        """
+        seconds = stamps // 1_000_000
+        millis = ((stamps // 1000) % 1000).tolist()
+        starts = np.flatnonzero(np.diff(seconds, prepend=seconds[:1] - 1)).tolist() + [len(stamps)]
+        out = []
+        for begin, end in zip(starts, starts[1:]):
+            second = int(seconds[begin])
+            if second != self._second:
+                self._second = second
+                self._second_text = datetime.datetime.fromtimestamp(
+                    second, datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            prefix = self._second_text
+            out.extend(prefix + self._MILLIS[ms] for ms in millis[begin:end])
+        return out
+
+    def lines(self, n: int, span: Optional[float] = None) -> List[str]:
+        """
+        Generates the next ``n`` log lines (without newlines).
+        
+        Args:
+            n (int): The number of lines.
+            span (Optional[float]): Passed to :meth:`timestamps`.
+        
+        Returns:
+            List[str]: Lines of the form ``<timestamp> [<LEVEL>] <message>``.
+        """
+        stamps = self.format_timestamps(self.timestamps(n, span))
+        levels = [f" [{level}] " for level in self.levels.words.tolist()]
+        level_idx = self.levels.indices(self.rng.np, n).tolist()
+        if self.pool is not None:
+            messages = self.pool[self.rng.np.integers(0, len(self.pool), n)].tolist()
+        else:
+            messages = self.text.words(n, (5, 10))
+        return [stamp + levels[level] + message for stamp, level, message in zip(stamps, level_idx, messages)]
+
+    def chunks(self, n: Optional[int] = None, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Yields newline-terminated blocks of lines.
+        
+        Args:
+            n (Optional[int]): The total number of lines; None never stops.
+            chunk_size (int): Lines per block.
+        
+        Yields:
+            str: Up to ``chunk_size`` lines joined with newlines.
+        """
+        produced = 0
+        while n is None or produced < n:
+            count = chunk_size if n is None else min(chunk_size, n - produced)
+            yield '\n'.join(self.lines(count)) + '\n'
+            produced += count
+
+    @staticmethod
+    def _rotate(path: Path, backups: int):
+        for i in range(backups - 1, 0, -1):
+            older = path.with_name(f"{path.name}.{i}")
+            if older.exists():
+                os.replace(older, path.with_name(f"{path.name}.{i + 1}"))
+        if backups:
+            os.replace(path, path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+
+    def write(self, path, n: int, max_bytes: Optional[int] = None, backups: int = 5,
+              chunk_size: int = 65536) -> dict:
+        """
+        Writes ``n`` lines through a large buffer, rotating by size.
+        
+        Rotation follows ``logging.handlers.RotatingFileHandler``: when the
+        next line would push ``path`` past ``max_bytes`` it becomes
+        ``path.1``, older files shift up and at most ``backups`` are kept.
+        Files are only split at line boundaries.
+        
+        Args:
+            path: The active log file.
+            n (int): The number of lines.
+            max_bytes (Optional[int]): The size limit per file; None disables rotation.
+            backups (int): The number of rotated files to keep.
+            chunk_size (int): Lines generated and written at once.
+        
+        Returns:
+            dict: ``lines``, ``bytes`` and ``rotations``.
+        """
+        path = Path(path)
+        written = rotations = 0
+        f = open(path, 'wb', buffering=1 << 20)
+        try:
+            size = 0
+            for chunk in self.chunks(n, chunk_size):
+                data = chunk.encode('utf-8')
+                while data:
+                    if max_bytes is None or size + len(data) <= max_bytes:
+                        cut = len(data)
+                    else:
+                        # A full file rotates before anything else is written to it.
+                        cut = 0 if size >= max_bytes else data.rfind(b'\n', 0, max(0, max_bytes - size)) + 1
+                        if cut == 0 and size:
+                            f.close()
+                            self._rotate(path, backups)
+                            rotations += 1
+                            f = open(path, 'wb', buffering=1 << 20)
+                            size = 0
+                            continue
+                        if cut == 0:
+                            cut = data.find(b'\n') + 1
+                    f.write(data[:cut])
+                    size += cut
+                    written += cut
+                    data = data[cut:]
+        finally:
+            f.close()
+        return {'lines': n, 'bytes': written, 'rotations': rotations}
+
+    def replay(self, dest, lines_per_second: float, n: Optional[int] = None, tick: float = 0.01) -> int:
+        """
+        Emits lines in real time at a target rate, flushing every tick.
+        
+        Timestamps still come from the simulated clock; only the emission
+        is paced. Falling behind is caught up on the next tick.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            lines_per_second (float): The target emission rate.
+            n (Optional[int]): The total number of lines; None runs until interrupted.
+            tick (float): Seconds between writes.
+        
+        Returns:
+            int: The number of lines written.
+        """
+        emitted = 0
+        started = time.perf_counter()
+        with _open_sink(dest) as write:
+            while n is None or emitted < n:
+                target = int((time.perf_counter() - started + tick) * lines_per_second)
+                if n is not None:
+                    target = min(target, n)
+                if target > emitted:
+                    write('\n'.join(self.lines(target - emitted)) + '\n')
+                    emitted = target
+                    write.flush()
+                if n is None or emitted < n:
+                    time.sleep(tick)
+        return emitted
+
+
+class CorpusGenerator:
+    """
+    Streams Markdown, HTML or plain-text documents up to a target total size.
+
+    Documents are produced in batches: sizes come from a log-normal
+    distribution, block types (headings, paragraphs, lists, tables, code)
+    from an alias table over ``structure``, and prose from a sentence pool
+    sampled in bulk from ``TextGenerator`` and ``PhraseGenerator``. Each
+    batch is written with a single call. Batch ``i`` draws from
+    ``rng.child(i)``, so a seed reproduces the corpus.
+    """
+
+    FORMATS = {'markdown': '.md', 'html': '.html', 'text': '.txt'}
+    STRUCTURE = {'paragraph': 60, 'heading': 15, 'list': 10, 'table': 8, 'code': 7}
+    _CODE = ('html', 'css', 'javascript', 'sql')
+
+    def __init__(self, rng=None, format: str = 'markdown', doc_bytes: int = 8192, sigma: float = 1.0,
+                 min_doc_bytes: int = 256, max_doc_bytes: int = 4 << 20, structure: Optional[dict] = None,
+                 batch_size: int = 256):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            format (str): 'markdown', 'html' or 'text'.
+            doc_bytes (int): The median document size.
+            sigma (float): The log-normal spread of document sizes; 0 makes
+                every document ``doc_bytes`` long.
+            min_doc_bytes (int): The smallest document size.
+            max_doc_bytes (int): The largest document size.
+            structure (Optional[dict]): Relative frequency of each block type
+                (keys of ``STRUCTURE``); missing types never occur.
+            batch_size (int): Documents generated and written at once.
+        
+        Raises:
+            ValueError: If the format or a block type is unknown.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown format '{format}'. Choose from {list(self.FORMATS)}.")
+        structure = structure or self.STRUCTURE
+        unknown = set(structure) - set(self.STRUCTURE)
+        if unknown:
+            raise ValueError(f"Unknown block types {sorted(unknown)}. Choose from {list(self.STRUCTURE)}.")
+        self.rng = SoupRandom.wrap(rng)
+        self.format = format
+        self.doc_bytes = doc_bytes
+        self.sigma = sigma
+        self.min_doc_bytes = min_doc_bytes
+        self.max_doc_bytes = max_doc_bytes
+        self.blocks = WordSampler(np.array(list(structure), dtype=object), list(structure.values()))
+        self.batch_size = batch_size
+
+    def _sizes(self, rng: SoupRandom, n: int) -> List[int]:
+        sizes = self.doc_bytes * np.exp(rng.np.normal(0, self.sigma, n)) if self.sigma else np.full(n, self.doc_bytes)
+        return np.clip(sizes, self.min_doc_bytes, self.max_doc_bytes).astype(np.int64).tolist()
+
+    class _Pool:
+        """Sentences, table terms and code snippets drawn in bulk and handed out in order."""
+
+        SNIPPETS = 64
+
+        def __init__(self, rng: SoupRandom, per_refill: int):
+            self.text = TextGenerator(rng)
+            self.phrase = PhraseGenerator(rng)
+            self.per_refill = max(per_refill, 64)
+            self._items = {'sentences': ([], 0), 'terms': ([], 0)}
+            code = CodeGenerator(rng)
+            self.snippets = [(language, getattr(code, language)())
+                             for language in rng.py.choices(CorpusGenerator._CODE, k=self.SNIPPETS)]
+
+        def _refill(self, kind: str) -> List[str]:
+            n = self.per_refill
+            if kind == 'terms':
+                return self.text.nouns(n, (1, 2))
+            pool = (self.text.words(n // 2, (5, 14)) + self.phrase.noams(n // 4)
+                    + self.phrase.similes(n // 8) + self.phrase.cliches(n - n // 2 - n // 4 - n // 8))
+            return [pool[i] for i in self.text.rng.np.permutation(len(pool)).tolist()]
+
+        def take(self, k: int, kind: str = 'sentences') -> List[str]:
+            items, start = self._items[kind]
+            while start + k > len(items):
+                items, start = items[start:] + self._refill(kind), 0
+            self._items[kind] = (items, start + k)
+            return items[start:start + k]
+
+    def _render(self, kind: str, rng: SoupRandom, pool: "_Pool") -> str:
+        fmt = self.format
+        esc = html.escape if fmt == 'html' else (lambda text: text)
+        draw = rng.py
+        if kind == 'heading':
+            title = esc(pool.take(1)[0].rstrip('.'))
+            level = draw.randint(2, 4)
+            if fmt == 'markdown':
+                return f"{'#' * level} {title}\n\n"
+            if fmt == 'html':
+                return f"<h{level}>{title}</h{level}>\n"
+            return f"{title}\n{'-' * len(title)}\n\n"
+        if kind == 'paragraph':
+            body = esc(' '.join(pool.take(draw.randint(2, 6))))
+            return f"<p>{body}</p>\n" if fmt == 'html' else f"{body}\n\n"
+        if kind == 'list':
+            items = [esc(item) for item in pool.take(draw.randint(3, 7))]
+            if fmt == 'html':
+                return '<ul>\n' + ''.join(f"  <li>{item}</li>\n" for item in items) + '</ul>\n'
+            return ''.join(f"- {item}\n" for item in items) + '\n'
+        if kind == 'table':
+            columns, rows = draw.randint(2, 5), draw.randint(2, 8)
+            terms = [esc(term) for term in pool.take(columns * (rows + 1), 'terms')]
+            header = [term.title() for term in terms[:columns]]
+            cells = [terms[i:i + columns] for i in range(columns, len(terms), columns)]
+            if fmt == 'markdown':
+                lines = [header, ['---'] * columns] + cells
+                return ''.join('| ' + ' | '.join(line) + ' |\n' for line in lines) + '\n'
+            if fmt == 'html':
+                head = ''.join(f"<th>{cell}</th>" for cell in header)
+                body = ''.join('<tr>' + ''.join(f"<td>{cell}</td>" for cell in row) + '</tr>\n' for row in cells)
+                return f"<table>\n<tr>{head}</tr>\n{body}</table>\n"
+            return ''.join('\t'.join(line) + '\n' for line in [header] + cells) + '\n'
+        language, snippet = draw.choice(pool.snippets)
+        if fmt == 'markdown':
+            return f"```{language}\n{snippet}\n```\n\n"
+        if fmt == 'html':
+            return f'<pre><code class="language-{language}">{esc(snippet)}</code></pre>\n'
+        return ''.join(f"    {line}\n" for line in snippet.splitlines()) + '\n'
+
+    def _document(self, title: str, size: int, rng: SoupRandom, pool: "_Pool") -> str:
+        fmt = self.format
+        if fmt == 'markdown':
+            parts = [f"# {title}\n\n"]
+        elif fmt == 'html':
+            parts = [f'<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+                     f'</head>\n<body>\n<h1>{html.escape(title)}</h1>\n']
+        else:
+            parts = [f"{title}\n{'=' * len(title)}\n\n"]
+        length = _utf8_len(parts[0])
+        kinds = []
+        while length < size:
+            if not kinds:
+                kinds = self.blocks.sample(rng.np, 256).tolist()
+            block = self._render(kinds.pop(), rng, pool)
+            parts.append(block)
+            length += _utf8_len(block)
+        if fmt == 'html':
+            parts.append('</body>\n</html>\n')
+        return ''.join(parts)
+
+    def documents(self, n: Optional[int] = None, total_bytes: Optional[int] = None) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Yields batches of ``(title, document)`` pairs.
+        
+        Generation stops after ``n`` documents or once about ``total_bytes``
+        UTF-8 bytes have been produced (the last document is shortened to
+        the remaining budget), whichever comes first.
+        
+        Args:
+            n (Optional[int]): The number of documents.
+            total_bytes (Optional[int]): The approximate total size.
+        
+        Yields:
+            List[Tuple[str, str]]: Up to ``batch_size`` documents.
+        
+        Raises:
+            ValueError: If neither limit is given.
+        """
+        if n is None and total_bytes is None:
+            raise ValueError("Pass a document count, a total size, or both.")
+        produced = size_so_far = 0
+        batch = 0
+        while (n is None or produced < n) and (total_bytes is None or size_so_far < total_bytes):
+            rng = self.rng.child(batch)
+            count = self.batch_size if n is None else min(self.batch_size, n - produced)
+            sizes = self._sizes(rng, count)
+            pool = self._Pool(rng, sum(sizes) // 60)
+            titles = [f"{a} {b}" for a, b in zip(pool.text.adjectives(count, case='title'),
+                                                pool.text.nouns(count, (1, 3), case='title'))]
+            docs = []
+            for title, size in zip(titles, sizes):
+                if total_bytes is not None:
+                    size = min(size, total_bytes - size_so_far)
+                    if size <= 0:
+                        break
+                doc = self._document(title, size, rng, pool)
+                docs.append((title, doc))
+                size_so_far += _utf8_len(doc)
+            produced += len(docs)
+            batch += 1
+            if docs:
+                yield docs
+
+    def write(self, dest, total_bytes: int, n: Optional[int] = None) -> int:
+        """
+        Streams a corpus into one file, documents separated by blank lines.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            total_bytes (int): The approximate total size.
+            n (Optional[int]): An optional cap on the number of documents.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            for docs in self.documents(n, total_bytes):
+                written += write('\n'.join(doc for _, doc in docs) + '\n')
+        return written
+
+    def write_files(self, directory, total_bytes: int, n: Optional[int] = None, per_dir: int = 1000,
+                    manifest: Optional[str] = 'manifest.csv',
+                    progress: Optional[Callable[[int, int], None]] = None) -> dict:
+        """
+        Writes one file per document into numbered subdirectories.
+        
+        Args:
+            directory: The output directory (created if missing).
+            total_bytes (int): The approximate total size.
+            n (Optional[int]): An optional cap on the number of documents.
+            per_dir (int): Documents per subdirectory.
+            manifest (Optional[str]): Name of a CSV manifest (file, bytes,
+                title) written into ``directory``, or None to skip it.
+            progress (Optional[Callable[[int, int], None]]): Called with the
+                documents and bytes written after each batch.
+        
+        Returns:
+            dict: ``documents`` and ``bytes`` written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        extension = self.FORMATS[self.format]
+        count = written = 0
+        with ExitStack() as stack:
+            writer = None
+            if manifest:
+                f = stack.enter_context(open(directory / manifest, 'w', newline='', encoding='utf-8'))
+                writer = csv.writer(f)
+                writer.writerow(['file', 'bytes', 'title'])
+            for docs in self.documents(n, total_bytes):
+                batch_bytes = 0
+                for title, doc in docs:
+                    sub = directory / f"{count // per_dir:05d}"
+                    if count % per_dir == 0:
+                        sub.mkdir(exist_ok=True)
+                    data = doc.encode('utf-8')
+                    name = f"{sub.name}/doc-{count:08d}{extension}"
+                    with open(directory / name, 'wb') as out:
+                        out.write(data)
+                    if writer:
+                        writer.writerow([name, len(data), title])
+                    count += 1
+                    batch_bytes += len(data)
+                written += batch_bytes
+                if progress:
+                    progress(len(docs), batch_bytes)
+        return {'documents': count, 'bytes': written}
+
+
+class _SchemaContext:
+    """Generators and row offset shared by the columns of one schema run."""
+
+    def __init__(self, rng, offset: int = 0):
+        self.rng = SoupRandom.wrap(rng)
+        self.text = TextGenerator(self.rng)
+        self.phrase = PhraseGenerator(self.rng)
+        self.time = TimeGenerator(self.rng)
+        self.offset = offset
+        self._unique_ids = {}
+
+    def unique_ids(self, length: int) -> UniqueIdGenerator:
+        """ID generator keyed by the seed entropy, shared by every shard of a run."""
+        if length not in self._unique_ids:
+            self._unique_ids[length] = UniqueIdGenerator(length, key=self.rng.entropy)
+        return self._unique_ids[length]
+
+
+def _field_choice(ctx: _SchemaContext, n: int, choices) -> List:
+    choices = np.array(list(choices), dtype=object)
+    return choices[ctx.rng.np.integers(0, len(choices), n)].tolist()
+
+
+class Schema:
+    """
+    A declarative record definition compiled once into a batched plan.
+
+    Each field maps a column name to a spec: a kind name (``'phone'``), a
+    call-style string (``'alphanumeric(8)'``, ``'enum(active, pending)'``),
+    a tuple (``('int', 18, 80)``) or a callable ``f(ctx, n) -> column``.
+    Specs are parsed and resolved once in ``__init__``; every run then fills
+    whole columns at a time.
+
+        schema = Schema({'id': 'sequence', 'name': 'name', 'price': 'price(1, 50)'})
+        schema.write_jsonl('items.jsonl', 1_000_000, rng=42)
+    """
+
+    FIELDS: dict = {
+        'noun': lambda ctx, n, words=1: ctx.text.nouns(n, words),
+        'adjective': lambda ctx, n, words=1: ctx.text.adjectives(n, words),
+        'adverb': lambda ctx, n, words=1: ctx.text.adverbs(n, words),
+        'verb': lambda ctx, n, words=1: ctx.text.verbs(n, words),
+        'word': lambda ctx, n, words=5: ctx.text.words(n, words),
+        'alphanumeric': lambda ctx, n, length=8: ctx.text.alphanumerics(n, length),
+        'number': lambda ctx, n, length=6: ctx.text.numbers(n, length),
+        'name': lambda ctx, n: ctx.text.nouns(n, 2, case='title'),
+        'email': lambda ctx, n, domain='example.com': [f"{local}@{domain}" for local in ctx.text.alphanumerics(n, 8)],
+        'phone': lambda ctx, n: ctx.text.phones(n),
+        'address': lambda ctx, n: ctx.text.addresses(n),
+        'company': lambda ctx, n: ctx.text.companies(n),
+        'noam': lambda ctx, n: ctx.phrase.noams(n),
+        'simile': lambda ctx, n: ctx.phrase.similes(n),
+        'cliche': lambda ctx, n: ctx.phrase.cliches(n),
+        'int': lambda ctx, n, low=0, high=100: ctx.rng.np.integers(low, high + 1, n),
+        'float': lambda ctx, n, low=0.0, high=1.0, decimals=2: np.round(ctx.rng.np.uniform(low, high, n), decimals),
+        'price': lambda ctx, n, low=1.0, high=999.99: np.round(ctx.rng.np.uniform(low, high, n), 2),
+        'bool': lambda ctx, n, p=0.5: ctx.rng.np.random(n) < p,
+        'enum': lambda ctx, n, *choices: _field_choice(ctx, n, choices),
+        'date': lambda ctx, n, start_year=2000, end_year=2024, order=None:
+            ctx.time.isoformat(ctx.time.dates(n, start_year, end_year, order)),
+        'timestamp': lambda ctx, n, start=2000, end=2024, resolution='s', order=None:
+            ctx.time.isoformat(ctx.time.timestamps(n, start, end, resolution, order)),
+        'sequence': lambda ctx, n, start=1: np.arange(ctx.offset + start, ctx.offset + start + n),
+        'unique_id': lambda ctx, n, length=8: ctx.unique_ids(length).ids(ctx.offset, n),
+        'constant': lambda ctx, n, value=None: [value] * n,
+    }
+
+    _CALL = re.compile(r'^\s*(\w+)\s*(?:\((.*)\))?\s*$', re.S)
+
+    def __init__(self, fields: dict):
+        """
+        Args:
+            fields (dict): Column name to field spec, in output order.
+        
+        Raises:
+            ValueError: If a spec is malformed or names an unknown kind.
+        """
+        self.fields = dict(fields)
+        self.plan = [(name, *self._compile(name, spec)) for name, spec in self.fields.items()]
+
+    @classmethod
+    def register(cls, kind: str, builder: Callable):
+        """
+        Registers a field kind.
+        
+        Args:
+            kind (str): The name used in specs.
+            builder (Callable): ``builder(ctx, n, *args)`` returning a column
+                of ``n`` values; ``ctx`` exposes ``rng``, ``text``, ``phrase``,
+                ``time`` and the row ``offset``.
+        """
+        cls.FIELDS[kind] = builder
+
+    @staticmethod
+    def _parse_args(raw: str) -> tuple:
+        """Parses call arguments; bare words are taken as strings."""
+        try:
+            return ast.literal_eval(f'({raw},)')
+        except (ValueError, SyntaxError):
+            pass
+        args = []
+        for arg in next(csv.reader([raw], skipinitialspace=True)):
+            try:
+                args.append(ast.literal_eval(arg))
+            except (ValueError, SyntaxError):
+                args.append(arg.strip())
+        return tuple(args)
+
+    def _compile(self, name: str, spec) -> tuple:
+        if callable(spec):
+            return spec, ()
+        if isinstance(spec, (tuple, list)):
+            kind, args = spec[0], tuple(spec[1:])
+        else:
+            match = self._CALL.match(str(spec))
+            if not match:
+                raise ValueError(f"Malformed spec for field '{name}': {spec!r}")
+            kind, raw = match.groups()
+            args = self._parse_args(raw) if raw and raw.strip() else ()
+        if kind not in self.FIELDS:
+            raise ValueError(f"Unknown field kind '{kind}' for field '{name}'.")
+        return self.FIELDS[kind], args
+
+    def _run(self, ctx: _SchemaContext, n: int) -> RecordBatch:
+        batch = RecordBatch((name, builder(ctx, n, *args)) for name, builder, args in self.plan)
+        ctx.offset += n
+        return batch
+
+    def generate(self, n: int, rng=None, offset: int = 0) -> RecordBatch:
+        """
+        Generates ``n`` records as columns.
+        
+        Args:
+            n (int): The number of records.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            offset (int): Index of the first record (used by 'sequence').
+        
+        Returns:
+            RecordBatch: One column per field.
+        """
+        return self._run(_SchemaContext(rng, offset), n)
+
+    def batches(self, n: int, batch_size: int = 50000, rng=None, offset: int = 0) -> Iterator[RecordBatch]:
+        """
+        Generates ``n`` records as consecutive batches.
+        
+        Yields:
+            RecordBatch: Up to ``batch_size`` records each.
+        """
+        ctx = _SchemaContext(rng, offset)
+        for start in range(0, n, batch_size):
+            yield self._run(ctx, min(batch_size, n - start))
+
+    def dicts(self, n: int, rng=None) -> List[dict]:
+        """Generates ``n`` records as dicts."""
+        return self.generate(n, rng).to_dicts()
+
+    @staticmethod
+    def csv_chunk(batch: RecordBatch) -> str:
+        """Formats a batch as CSV lines (without header)."""
+        out = io.StringIO()
+        csv.writer(out, lineterminator='\n').writerows(zip(*batch._lists()))
+        return out.getvalue()
+
+    @staticmethod
+    def jsonl_chunk(batch: RecordBatch) -> str:
+        """Formats a batch as JSON lines."""
+        encode = json.JSONEncoder(default=str).encode
+        return ''.join(encode(row) + '\n' for row in batch.rows())
+
+    def write_csv(self, dest, n: int, rng=None, batch_size: int = 50000) -> int:
+        """
+        Streams ``n`` records to a CSV file with a header row.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            n (int): The number of records.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            batch_size (int): Records generated and written at once.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        with _open_sink(dest) as write:
+            written = write(','.join(self.fields) + '\n')
+            for batch in self.batches(n, batch_size, rng):
+                written += write(self.csv_chunk(batch))
+        return written
+
+    def write_jsonl(self, dest, n: int, rng=None, batch_size: int = 50000) -> int:
+        """
+        Streams ``n`` records to a JSON Lines file.
+        
+        Args:
+            dest: A file path, or an open text or binary file object.
+            n (int): The number of records.
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            batch_size (int): Records generated and written at once.
+        
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            for batch in self.batches(n, batch_size, rng):
+                written += write(self.jsonl_chunk(batch))
+        return written
+
+
+def _shard_people(rng: SoupRandom, start: int, count: int, params: dict) -> RecordBatch:
+    data = DataGenerator(rng, params.get('unique_ids', False))
+    if data.unique_ids:
+        data.person_ids.seek(start)
+    return data.people(count)
+
+
+def _shard_products(rng: SoupRandom, start: int, count: int, params: dict) -> RecordBatch:
+    data = DataGenerator(rng, params.get('unique_ids', False))
+    if data.unique_ids:
+        data.product_ids.seek(start)
+    return data.products(count)
+
+
+def _shard_csv(rng: SoupRandom, start: int, count: int, params: dict) -> bytes:
+    files = FileGenerator(rng, params.get('unique_ids', False))
+    if files.unique_ids:
+        files.csv_ids.seek(start)
+    return ''.join(line + '\n' for line in files.csv_rows(count)).encode('utf-8')
+
+
+def _render_image(kind: str, width: int, height: int, rng: SoupRandom) -> np.ndarray:
+    """Renders the pixels ``SoupImage``/``SoupImageRGB``/``SoupPattern`` would save for ``rng``."""
+    if kind == 'gray':
+        return rng.np.integers(0, 256, size=(height, width), dtype=np.uint8)
+    if kind == 'rgb':
+        return rng.np.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    if kind not in PatternEngine.PATTERNS:
+        kind = 'noise'
+    return PatternEngine(width, height, kind, rng).render()
+
+
+def _shard_images(rng: SoupRandom, start: int, count: int, params: dict) -> List[tuple]:
+    extension = _IMAGE_FORMATS[params['format']][1]
+    entries = []
+    for index in range(start, start + count):
+        name = f"{params['prefix']}{index:07d}{extension}"
+        pixels = _render_image(params['kind'], params['width'], params['height'], rng.child(index))
+        data = io.BytesIO()
+        with Instrumentation.span('ParallelGenerator.encode', name):
+            _encode_image(pixels, params['format'], data, params['compress_level'], params['quality'])
+        with open(Path(params['directory']) / name, 'wb') as f:
+            f.write(data.getbuffer())
+        entries.append((index, name, data.tell()))
+    return entries
+
+
+def _shard_audio(rng: SoupRandom, start: int, count: int, params: dict) -> List[tuple]:
+    entries = []
+    for index in range(start, start + count):
+        name = f"{params['prefix']}{index:07d}.wav"
+        path = str(Path(params['directory']) / name)
+        audio = Audio(rng.child(index))
+        if params['kind'] == 'tone':
+            audio.tone(params['frequency'], params['duration'], params['sample_rate'], filepath=path)
+        else:
+            audio.wav(params['duration'], params['sample_rate'], filepath=path)
+        entries.append((index, name, os.path.getsize(path)))
+    return entries
+
+
+def _shard_logs(rng: SoupRandom, start: int, count: int, params: dict) -> List[str]:
+    rate = params.get('rate', 1000.0)
+    begin = params.get('start', datetime.datetime(2024, 1, 1)) + datetime.timedelta(seconds=start / rate)
+    stream = LogStream(rng, rate, params.get('distribution', 'poisson'), begin)
+    return stream.lines(count, span=count / rate)
+
+
+def _shard_tweets(rng: SoupRandom, start: int, count: int, params: dict) -> List[str]:
+    return SocialMediaGenerator(rng).tweets(count)
+
+
+_SHARD_JOBS = {
+    'people': _shard_people,
+    'products': _shard_products,
+    'csv': _shard_csv,
+    'logs': _shard_logs,
+    'tweets': _shard_tweets,
+    'images': _shard_images,
+    'audio': _shard_audio,
+}
+
+
+# Jobs that seed each file from ``rng.child(index)`` and so are independent of the shard size.
+_FILE_JOBS = ('images', 'audio')
+
+
+def _shard_plan(rng: SoupRandom, n: int, shard_size: int, job: Optional[str] = None) -> Iterator[tuple]:
+    """Yields ``(rng.child(i), start, count)`` for each fixed-size shard of ``n`` records (``rng`` itself for file jobs)."""
+    for i, start in enumerate(range(0, n, shard_size)):
+        yield rng if job in _FILE_JOBS else rng.child(i), start, min(shard_size, n - start)
+
+
+def _run_shard(job: str, rng: SoupRandom, start: int, count: int, params: dict):
+    """Runs one shard of a registered job; executed inside pool workers."""
+    return _SHARD_JOBS[job](rng, start, count, params)
+
+
+class ParallelGenerator:
+    """
+    Runs generation jobs as fixed-size shards on a process pool.
+
+    Shard ``i`` covers records ``[i * shard_size, (i + 1) * shard_size)`` and
+    always draws from ``rng.child(i)`` (files from ``rng.child(index)``), so the
+    output for a given seed and shard size is identical for any worker count.
+    """
+
+    # Upper bound on the default number of files per shard.
+    FILE_SHARD_CAP = 64
+
+    def __init__(self, rng=None, workers: Optional[int] = None, shard_size: int = 10000,
+                 file_shard_size: Optional[int] = None):
+        """
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            workers (Optional[int]): Worker processes; defaults to the CPU count.
+            shard_size (int): Records per shard.
+            file_shard_size (Optional[int]): Files per shard for image and audio
+                jobs; defaults to ``ceil(n / (4 * workers))``, capped at
+                ``FILE_SHARD_CAP``. Files are seeded by index, so this never
+                changes the output.
+        """
+        self.rng = SoupRandom.wrap(rng)
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.file_shard_size = file_shard_size
+
+    def map(self, job: str, n: int, params: Optional[dict] = None, shard_size: Optional[int] = None) -> Iterator:
+        """
+        Runs a registered job over ``n`` records and yields shard results in order.
+        
+        At most ``2 * workers`` shards are in flight, so results can be
+        streamed to disk without holding the whole job in memory.
+        
+        Args:
+            job (str): A key of the shard job registry.
+            n (int): The total number of records or files.
+            params (Optional[dict]): Job parameters passed to every shard.
+            shard_size (Optional[int]): Overrides ``self.shard_size`` for this job.
+        
+        Yields:
+            The result of each shard, in shard order.
+        """
+        params = params or {}
+        shard_size = shard_size or self.shard_size
+        shards = _shard_plan(self.rng, n, shard_size, job)
+        if self.workers <= 1 or n <= shard_size:
+            for shard in shards:
+                yield _run_shard(job, *shard, params)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for shard in shards:
+                pending.append(pool.submit(_run_shard, job, *shard, params))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def people(self, n: int, unique_ids: bool = False) -> RecordBatch:
+        """Generate ``n`` person records in parallel"""
+        return RecordBatch.concat(list(self.map('people', n, {'unique_ids': unique_ids})))
+
+    def products(self, n: int, unique_ids: bool = False) -> RecordBatch:
+        """Generate ``n`` product records in parallel"""
+        return RecordBatch.concat(list(self.map('products', n, {'unique_ids': unique_ids})))
+
+    def write_csv(self, dest, rows: int, unique_ids: bool = False) -> int:
         """
-        samples = int(duration * sample_rate)
-        audio_data = np.random.uniform(-1, 1, samples)
-        data = (audio_data * 32767).astype(np.int16)
+        Generate CSV rows in parallel and stream them to a file in order
         
-        if filepath:
-            with wave.open(filepath, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(data.tobytes())
+        Args:
+            dest: A file path, or an open text or binary file object.
+            rows (int): The number of data rows to write.
+            unique_ids (bool): Give every row a distinct id.
         
-        return data
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        with _open_sink(dest) as write:
+            written += write(','.join(FileGenerator.csv_headers) + '\n')
+            for chunk in self.map('csv', rows, {'unique_ids': unique_ids}):
+                written += write(chunk.decode('utf-8'))
+        return written
 
-    def tone(self, frequency=440, duration=1.0, sample_rate=44100, filepath=None):
+    def _files(self, job: str, directory: Path, n: int, params: dict, manifest: Optional[str],
+               columns: dict, progress: Optional[Callable[[int, int], None]]) -> List[str]:
+        # Runs a file job, writing manifest rows (index, file, *columns, bytes) as shards finish.
+        paths = []
+        with ExitStack() as stack:
+            writer = None
+            if manifest:
+                f = stack.enter_context(open(directory / manifest, 'w', newline='', encoding='utf-8'))
+                writer = csv.writer(f)
+                writer.writerow(['index', 'file', *columns, 'bytes'])
+            shard_size = self.file_shard_size or max(1, min(self.FILE_SHARD_CAP, -(-n // (4 * self.workers))))
+            for entries in self.map(job, n, params, shard_size):
+                for index, name, size in entries:
+                    paths.append(str(directory / name))
+                    if writer:
+                        writer.writerow([index, name, *columns.values(), size])
+                if progress:
+                    progress(len(entries), sum(size for _, _, size in entries))
+        return paths
+
+    def images(self, directory, n: int, width: int, height: int, kind: str = 'rgb',
+               prefix: str = 'image_', format: str = 'png', compress_level: int = 6,
+               quality: int = 90, manifest: Optional[str] = 'manifest.csv',
+               progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
         """
-        Generate a pure tone
-        frequency: in Hz
+        Generate an image dataset of ``n`` files in parallel
+        
+        Every image is rendered and encoded in memory by a worker and written
+        with a single call. Lower PNG ``compress_level`` values (or 'bmp' /
+        'ppm') trade disk space for encode speed.
+        
+        Args:
+            directory: The output directory (created if missing).
+            n (int): The number of images.
+            width (int): The image width.
+            height (int): The image height.
+            kind (str): 'gray', 'rgb', or a ``SoupPattern`` pattern type.
+            prefix (str): The file name prefix.
+            format (str): One of 'png', 'jpeg', 'webp', 'bmp' or 'ppm'.
+            compress_level (int): PNG zlib level, 0 (fastest) to 9 (smallest).
+            quality (int): JPEG/WebP quality, 1 to 100.
+            manifest (Optional[str]): Name of a CSV manifest written into
+                ``directory`` (index, file, width, height, kind, format,
+                bytes), or None to skip it.
+            progress (Optional[Callable[[int, int], None]]): Called with the
+                files and bytes written after each shard.
+        
+        Returns:
+            List[str]: The written paths, in index order.
+        
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if format not in _IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format '{format}'. Choose from {list(_IMAGE_FORMATS)}.")
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        params = dict(directory=str(directory), width=width, height=height, kind=kind, prefix=prefix,
+                      format=format, compress_level=compress_level, quality=quality)
+        columns = dict(width=width, height=height, kind=kind, format=format)
+        return self._files('images', directory, n, params, manifest, columns, progress)
+
+    def audio(self, directory, n: int, duration: float = 1.0, sample_rate: int = 44100,
+              kind: str = 'noise', frequency: float = 440, prefix: str = 'audio_',
+              manifest: Optional[str] = 'manifest.csv',
+              progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
         """
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        audio_data = np.sin(2 * np.pi * frequency * t)
-        data = (audio_data * 32767).astype(np.int16)
+        Generate ``n`` WAV files in parallel
         
-        if filepath:
-            with wave.open(filepath, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(data.tobytes())
+        Args:
+            directory: The output directory (created if missing).
+            n (int): The number of files.
+            duration (float): The length of each file in seconds.
+            sample_rate (int): Samples per second.
+            kind (str): 'noise' or 'tone'.
+            frequency (float): The tone frequency in Hz.
+            prefix (str): The file name prefix.
+            manifest (Optional[str]): Name of a CSV manifest written into
+                ``directory`` (index, file, duration, sample_rate, kind,
+                bytes), or None to skip it.
+            progress (Optional[Callable[[int, int], None]]): Called with the
+                files and bytes written after each shard.
         
-        return data
+        Returns:
+            List[str]: The written paths, in index order.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        params = dict(directory=str(directory), duration=duration, sample_rate=sample_rate,
+                      kind=kind, frequency=frequency, prefix=prefix)
+        columns = dict(duration=duration, sample_rate=sample_rate, kind=kind)
+        return self._files('audio', directory, n, params, manifest, columns, progress)
 
 
-class DataGenerator:
+class AsyncStream:
     """
-    Generate structured data
+    Async iterators over record batches with consumer backpressure.
+
+    Each batch is generated on an executor (the loop's default thread pool,
+    or e.g. a ``ProcessPoolExecutor`` for CPU-heavy runs) so the event loop
+    never blocks on generation. At most ``prefetch`` batches are produced
+    ahead of the consumer; nothing more is scheduled until it asks for the
+    next batch. Batch ``i`` draws from ``rng.child(i)``, the same plan as
+    ``ParallelGenerator``, so output is deterministic for a seed.
+
+        async for batch in AsyncStream(rng=1).people(1_000_000):
+            await send(batch.to_dicts())
     """
-    
-    def __init__(self):
-        self.text = TextGenerator()
-        self.phrase = PhraseGenerator()
 
-    def person(self):
+    def __init__(self, rng=None, batch_size: int = 10000, prefetch: int = 2, executor=None):
         """
-        Generate random person data
+        Args:
+            rng: A seed or RNG accepted by ``SoupRandom.wrap``.
+            batch_size (int): Records per batch.
+            prefetch (int): Batches generated ahead of the consumer.
+            executor: A ``concurrent.futures`` executor; None uses the loop default.
         """
-        return {
-            "id": self.text.alphanumeric(8),
-            "name": f"{self.text.noun(1).title()} {self.text.noun(1).title()}",
-            "age": random.randint(18, 80),
-            "email": f"{self.text.alphanumeric(8)}@example.com",
-            "bio": self.phrase.noam(),
-            "phone": self.text.phone(),
-            "address": self.text.address()
-        }
+        self.rng = SoupRandom.wrap(rng)
+        self.batch_size = batch_size
+        self.prefetch = max(0, prefetch)
+        self.executor = executor
 
-    def product(self):
+    async def batches(self, job: str, n: int, params: Optional[dict] = None):
         """
-        Generate random product data
+        Yields the shard results of a registered job in order.
+        
+        Args:
+            job (str): A key of the shard job registry ('people', 'products',
+                'logs', 'tweets', ...).
+            n (int): The total number of records.
+            params (Optional[dict]): Job parameters passed to every batch.
         """
-        return {
-            "id": self.text.alphanumeric(6),
-            "name": f"{self.text.adjective(1)} {self.text.noun(1)}",
-            "price": round(random.uniform(1.0, 999.99), 2),
-            "description": self.phrase.noam(),
-            "in_stock": random.choice([True, False]),
-            "company": self.text.company()
-        }
+        import asyncio
 
+        loop = asyncio.get_running_loop()
+        params = params or {}
+        pending = deque()
+        try:
+            for shard in _shard_plan(self.rng, n, self.batch_size, job):
+                pending.append(loop.run_in_executor(self.executor, _run_shard, job, *shard, params))
+                if len(pending) > self.prefetch:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
 
-class SoupPattern(SoupImageRGB):
+    def people(self, n: int, unique_ids: bool = False):
+        """Async iterator of person ``RecordBatch`` objects"""
+        return self.batches('people', n, {'unique_ids': unique_ids})
+
+    def products(self, n: int, unique_ids: bool = False):
+        """Async iterator of product ``RecordBatch`` objects"""
+        return self.batches('products', n, {'unique_ids': unique_ids})
+
+    def logs(self, n: int):
+        """Async iterator of log line lists"""
+        return self.batches('logs', n)
+
+    def tweets(self, n: int):
+        """Async iterator of tweet lists"""
+        return self.batches('tweets', n)
+
+
+class ArtifactCache:
     """
-    Generate patterned images
+    Opt-in, content-addressed cache of generated files.
+
+    An artifact is keyed by a SHA-256 of the generator name, its parameters
+    and the seed, and stored once under ``directory``. A repeated request is
+    served by copying (or hard-linking) the stored file instead of
+    regenerating it. Entries are written to a temporary file and renamed
+    into place, so concurrent workers never see partial files; the last
+    writer of an identical entry simply wins. Entry modification times
+    record use, and the least recently used entries are evicted once the
+    cache exceeds ``max_bytes``.
+
+        cache = ArtifactCache()
+        cache.image('fixtures/bg.png', 1920, 1080, 'radial', seed=7)
     """
-    
-    def __init__(self, width, height, path, pattern_type='checker'):
-        self.width = width
-        self.height = height
-        self.path = path
+
+    # Bump to invalidate entries when generator output changes.
+    VERSION = 1
+
+    def __init__(self, directory=None, max_bytes: int = 1 << 30, link: bool = False):
+        """
+        Args:
+            directory: The cache directory; defaults to ``$SOUP_CACHE_DIR`` or
+                ``~/.cache/soupgenerator``.
+            max_bytes (int): The total size the cache is trimmed to after each store.
+            link (bool): Hard-link cached files to their destination instead of
+                copying them (falls back to copying across file systems).
+                Linked files share storage with the cache, so they must not be
+                modified in place.
+        """
+        directory = directory or os.environ.get('SOUP_CACHE_DIR') or Path.home() / '.cache' / 'soupgenerator'
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _seed_key(seed):
+        if isinstance(seed, int):
+            return [seed, []]
+        if isinstance(seed, SoupRandom) and seed._np is None and seed._py is None:
+            return [seed.entropy, list(seed.spawn_key)]
+        return None
+
+    def key(self, name: str, params: dict, seed) -> Optional[str]:
+        """
+        Computes the cache key of an artifact.
         
-        if pattern_type == 'checker':
-            self.pixels = self._checker_pattern()
-        elif pattern_type == 'gradient':
-            self.pixels = self._gradient_pattern()
-        else:
-            self.pixels = self._noise_pattern()
-            
-        img = PILImage.fromarray(self.pixels, 'RGB')
-        img.save(self.path)
-
-    def _checker_pattern(self, size=32):
-        pattern = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        for i in range(0, self.height, size):
-            for j in range(0, self.width, size):
-                if (i//size + j//size) % 2:
-                    pattern[i:i+size, j:j+size] = np.random.randint(0, 256, (3,))
-        return pattern
+        Args:
+            name (str): The generator name.
+            params (dict): JSON-serializable generator parameters.
+            seed: An int seed or an unused ``SoupRandom`` (e.g. ``rng.child(i)``).
+        
+        Returns:
+            Optional[str]: A hex digest, or None if the output is not
+            reproducible (no seed, or an RNG that has already been drawn from).
+        """
+        seed_key = self._seed_key(seed)
+        if seed_key is None:
+            return None
+        material = json.dumps([self.VERSION, name, params, seed_key], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
 
-    def _gradient_pattern(self):
-        pattern = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        for i in range(self.height):
-            for j in range(self.width):
-                pattern[i,j] = [
-                    int(255 * i/self.height),
-                    int(255 * j/self.width),
-                    int(255 * (i+j)/(self.height+self.width))
-                ]
-        return pattern
+    def _entry(self, key: str, suffix: str) -> Path:
+        return self.directory / key[:2] / f"{key}{suffix}"
 
-    def _noise_pattern(self):
-        return np.random.randint(0, 256, (self.height, self.width, 3), dtype=np.uint8)
+    def _materialize(self, entry: Path, dest: Path):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if self.link:
+            tmp = dest.with_name(f".{dest.name}.{secrets.token_hex(4)}")
+            try:
+                os.link(entry, tmp)
+                os.replace(tmp, dest)
+                return
+            except OSError:
+                if tmp.exists():
+                    tmp.unlink()
+        shutil.copyfile(entry, dest)
 
+    def fetch(self, dest, name: str, params: dict, seed, produce: Callable[[Path], None]) -> Path:
+        """
+        Materializes an artifact at ``dest``, generating it only on a miss.
+        
+        Args:
+            dest: The output path; its suffix is part of the stored entry name.
+            name (str): The generator name.
+            params (dict): JSON-serializable generator parameters.
+            seed: An int seed or an unused ``SoupRandom``.
+            produce (Callable[[Path], None]): Writes the artifact to the given path.
+        
+        Returns:
+            Path: ``dest``.
+        """
+        dest = Path(dest)
+        key = self.key(name, params, seed)
+        if key is None:
+            produce(dest)
+            return dest
 
-class CodeGenerator:
-    """
-    Generate code snippets
-    """
-    
-    def __init__(self):
-        self.text = TextGenerator()
+        entry = self._entry(key, dest.suffix)
+        with Instrumentation.span('ArtifactCache.fetch', dest) as span:
+            try:
+                os.utime(entry)
+                self._materialize(entry, dest)
+                self.hits += 1
+                span['hit'] = 1
+                return dest
+            except FileNotFoundError:
+                pass
 
-    def html(self):
+            self.misses += 1
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=entry.parent, prefix=f".{entry.name}.", suffix=dest.suffix)
+            os.close(fd)
+            try:
+                produce(Path(tmp))
+                os.replace(tmp, entry)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+            self._materialize(entry, dest)
+        self.evict()
+        return dest
+
+    def entries(self) -> List[Path]:
+        """Lists the stored entries, least recently used first."""
+        stats = []
+        for path in self.directory.glob('??/*'):
+            if path.name.startswith('.'):
+                continue
+            try:
+                stats.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        return [path for _, path in sorted(stats)]
+
+    def size(self) -> int:
+        """The total size of the stored entries in bytes."""
+        total = 0
+        for path in self.entries():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
         """
-        Generate random HTML snippet
+        Deletes least recently used entries until the cache fits.
+        
+        Args:
+            max_bytes (Optional[int]): The target size; defaults to ``max_bytes``.
+        
+        Returns:
+            int: The number of entries removed.
         """
-        tags = ['div', 'p', 'span', 'section']
-        classes = [self.text.noun(1), self.text.adjective(1)]
-        tag = random.choice(tags)
-        return f'<{tag} class="{"-".join(classes)}">{self.text.word(5)}</{tag}>'
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = []
+        for path in self.entries():
+            try:
+                entries.append((path, path.stat().st_size))
+            except FileNotFoundError:
+                continue
+        total = sum(size for _, size in entries)
+        removed = 0
+        for path, size in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        return removed
 
-    def sql(self):
+    def clear(self) -> int:
+        """Removes every entry; returns the number removed."""
+        return self.evict(0)
+
+    def image(self, dest, width: int, height: int, kind: str = 'rgb', seed=None, **params) -> Path:
         """
-        Generate random SQL query
+        Cached ``SoupImage`` ('gray'), ``SoupImageRGB`` ('rgb') or ``SoupPattern`` (any other kind).
+        
+        Args:
+            dest: The output path; its suffix selects the format.
+            width (int): The image width.
+            height (int): The image height.
+            kind (str): 'gray', 'rgb', or a ``SoupPattern`` pattern type.
+            seed: An int seed or an unused ``SoupRandom``.
+            **params: Pattern options passed to ``SoupPattern``.
+        
+        Returns:
+            Path: ``dest``.
         """
-        tables = ['users', 'products', 'orders']
-        conditions = ['active = 1', 'created_at > NOW()', 'status = "pending"']
-        return f'SELECT * FROM {random.choice(tables)} WHERE {random.choice(conditions)} LIMIT {random.randint(10,100)};'
+        def produce(path):
+            if kind == 'gray':
+                SoupImage(width, height, str(path), rng=seed)
+            elif kind == 'rgb':
+                SoupImageRGB(width, height, str(path), rng=seed)
+            else:
+                SoupPattern(width, height, str(path), kind, rng=seed, **params)
 
-    def css(self) -> str:
-        """Generate random CSS rule"""
-        properties = {
-            'color': f'#{random.randint(0, 0xFFFFFF):06x}',
-            'margin': f'{random.randint(0, 30)}px',
-            'padding': f'{random.randint(0, 20)}px',
-            'font-size': f'{random.randint(12, 24)}px',
-            'border-radius': f'{random.randint(0, 10)}px'
-        }
+        return self.fetch(dest, 'image', dict(width=width, height=height, kind=kind, **params), seed, produce)
+
+    def audio(self, dest, duration: float = 1.0, seed=None, **params) -> Path:
+        """
+        Cached ``Audio.stream`` WAV output.
         
-        selector = f'.{self.text.noun(1)}'
-        props = [f"    {k}: {v};" for k, v in random.sample(properties.items(), 3)]
-        return f"{selector} {{\n" + "\n".join(props) + "\n}"
+        Args:
+            dest: The output path.
+            duration (float): The length in seconds.
+            seed: An int seed or an unused ``SoupRandom``.
+            **params: Options passed to ``Audio.stream`` (kind, color, ...).
+        
+        Returns:
+            Path: ``dest``.
+        """
+        produce = lambda path: Audio(seed).stream(str(path), duration, **params)
+        return self.fetch(dest, 'audio', dict(duration=duration, **params), seed, produce)
 
-    def javascript(self) -> str:
-        """Generate random JavaScript code"""
-        function_name = f"handle{self.text.noun(1).title()}"
-        param = self.text.noun(1).lower()
-        return f"""function {function_name}({param}) {{
-    console.log('Processing {param}...');
-    return {param}.toString().toUpperCase();
-}}"""
+    def csv(self, dest, rows: int, seed=None, unique_ids: bool = False) -> Path:
+        """
+        Cached ``FileGenerator.write_csv`` output.
+        
+        Args:
+            dest: The output path.
+            rows (int): The number of data rows.
+            seed: An int seed or an unused ``SoupRandom``.
+            unique_ids (bool): Give every row a distinct id.
+        
+        Returns:
+            Path: ``dest``.
+        """
+        produce = lambda path: FileGenerator(seed, unique_ids).write_csv(path, rows)
+        return self.fetch(dest, 'csv', dict(rows=rows, unique_ids=unique_ids), seed, produce)
 
 
-class TimeGenerator:
-    """
-    Generate time-related content
+def measure_import_time(runs: int = 5) -> dict:
     """
+    Measures the cold import time of this module in fresh interpreters.
     
-    def date(self, start_year=2000, end_year=2024):
+    Args:
+        runs (int): The number of interpreter launches; the fastest is reported.
+    
+    Returns:
+        dict: ``seconds`` (fastest import) and ``heavy_modules`` (entries of
+        ``HEAVY_MODULES`` loaded eagerly by the import, which should be empty).
+    """
+    import subprocess
+
+    probe = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import SoupGenerator\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([elapsed, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(Path(__file__).resolve().parent),
+                                                                     os.environ.get('PYTHONPATH')])))
+    timings, heavy = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, env=env, check=True)
+        elapsed, heavy = json.loads(out.stdout)
+        timings.append(elapsed)
+    return {'seconds': min(timings), 'heavy_modules': heavy}
+
+
+class Benchmark:
+    """
+    Measures the throughput of every public generator.
+
+    Record generators report records/s, media generators MB/s of encoded
+    output plus peak traced memory, and start-up cases report seconds.
+    Results are plain dicts that round-trip through JSON, so a run can be
+    stored as a baseline and compared against later runs.
+    """
+
+    VERSION = 1
+    LOWER_IS_BETTER = ('s',)
+
+    def __init__(self, scale: float = 1.0, repeat: int = 3, seed: int = 0):
         """
-        Generate random date
+        Args:
+            scale (float): Multiplier applied to every workload size.
+            repeat (int): Runs per case; the fastest one is reported.
+            seed (int): Seed for every generator under test.
         """
-        start = datetime.date(start_year, 1, 1)
-        end = datetime.date(end_year, 12, 31)
-        days_between = (end - start).days
-        random_days = random.randint(0, days_between)
-        return start + datetime.timedelta(days=random_days)
+        self.scale = scale
+        self.repeat = repeat
+        self.seed = seed
+        self._tmp = None
 
-    def timestamp(self):
+    def _n(self, base: int) -> int:
+        return max(1, int(base * self.scale))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._tmp, name)
+
+    def cases(self) -> List[tuple]:
         """
-        Generate random timestamp
+        Returns the benchmark cases as ``(name, unit, run, track_memory)``.
+        
+        ``run()`` performs one measured pass and returns the amount produced:
+        records for 'records/s', bytes for 'MB/s' (raw pixel bytes for images,
+        file bytes for audio). Cases in seconds return None.
         """
-        return self.date().strftime("%Y-%m-%d %H:%M:%S")
+        seed = self.seed
+        n_batch, n_scalar = self._n(200_000), self._n(5_000)
+        side, seconds = self._n(1024), 10 * self.scale
 
+        def scalar(method, n=n_scalar):
+            def run():
+                for _ in range(n):
+                    method()
+                return n
+            return run
 
-class SocialMediaGenerator:
-    """Generate social media style content"""
-    
-    def __init__(self):
-        self.text = TextGenerator()
-        self.phrase = PhraseGenerator()
+        def batch(method, n=n_batch):
+            def run():
+                method(n)
+                return n
+            return run
 
-    def tweet(self) -> str:
-        """Generate a tweet-like message"""
-        content = self.phrase.noam()
-        hashtags = self.text.hashtag(2)
-        emoji = self.text.emoji(1)
-        return f"{content} {hashtags} {emoji}"
-    
-    def comment(self) -> str:
-        """Generate a social media comment"""
-        patterns = [
-            lambda: f"{self.text.emoji(1)} {self.text.word(random.randint(3,8))}",
-            lambda: f"This is {self.text.adjective(1)}! {self.text.emoji(2)}",
-            lambda: f"{self.text.hashtag(1)} {self.text.emoji(1)}"
-        ]
-        return random.choice(patterns)()
+        def pixels(produce, name, channels):
+            def run():
+                produce(self._path(name))
+                return side * side * channels
+            return run
 
-    def username_with_handle(self) -> str:
-        """Generate username with handle"""
-        return f"@{self.text.username()}"
+        def file_size(produce, name):
+            def run():
+                produce(self._path(name))
+                return os.path.getsize(self._path(name))
+            return run
 
+        text, data, files, social = TextGenerator(seed), DataGenerator(seed), FileGenerator(seed), SocialMediaGenerator(seed)
+        cases = [
+            ('text.noun', 'records/s', scalar(lambda: text.noun(1)), False),
+            ('text.nouns', 'records/s', batch(text.nouns), False),
+            ('text.words', 'records/s', batch(lambda n: text.words(n, 6)), False),
+            ('text.alphanumerics', 'records/s', batch(lambda n: text.alphanumerics(n, 8)), False),
+            ('data.person', 'records/s', scalar(data.person), False),
+            ('data.people', 'records/s', batch(data.people), False),
+            ('data.products', 'records/s', batch(data.products), False),
+            ('file.log_entry', 'records/s', scalar(files.log_entry), False),
+            ('file.write_csv', 'records/s', batch(lambda n: files.write_csv(self._path('bench.csv'), n)), False),
+            ('social.tweet', 'records/s', scalar(social.tweet), False),
+            ('image.gray', 'MB/s', pixels(lambda p: SoupImage(side, side, p, rng=seed), 'gray.png', 1), True),
+            ('image.rgb', 'MB/s', pixels(lambda p: SoupImageRGB(side, side, p, rng=seed), 'rgb.png', 3), True),
+        ]
+        for pattern in PatternEngine.PATTERNS:
+            cases.append((f'pattern.{pattern}', 'MB/s',
+                          pixels(lambda p, t=pattern: SoupPattern(side, side, p, t, rng=seed), f'{pattern}.png', 3), True))
+        cases += [
+            ('audio.wav', 'MB/s', file_size(lambda p: Audio(seed).wav(seconds, filepath=p), 'noise.wav'), True),
+            ('audio.stream_pink', 'MB/s',
+             file_size(lambda p: Audio(seed).stream(p, seconds, color='pink', channels=2), 'pink.wav'), True),
+            ('libs.load', 's', self._load_libs, False),
+        ]
+        return cases
 
-class FileGenerator:
-    """Generate various file contents"""
-    
-    def __init__(self):
-        self.text = TextGenerator()
-        self.data = DataGenerator()
+    @staticmethod
+    def _load_libs():
+        LibraryLoader._cache.clear()
+        LibraryLoader._view_cache.clear()
+        LibraryLoader._array_cache.clear()
+        LibraryLoader._compiled_cache.clear()
+        LibraryLoader._sampler_cache.clear()
+        for path in sorted(LibraryLoader.lib_dir.glob('*.csv')):
+            LibraryLoader.load_lib(path.stem)
 
-    def csv_data(self, rows: int = 5) -> str:
-        """Generate CSV content"""
-        headers = ['id', 'name', 'email', 'status']
-        content = [','.join(headers)]
-        
-        for _ in range(rows):
-            row = [
-                self.text.alphanumeric(6),
-                f"{self.text.noun(1)} {self.text.noun(1)}",
-                f"{self.text.alphanumeric(8)}@example.com",
-                random.choice(['active', 'pending', 'inactive'])
-            ]
-            content.append(','.join(row))
+    def _measure(self, unit: str, run: Callable, track_memory: bool) -> dict:
+        values = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            amount = run()
+            elapsed = time.perf_counter() - start
+            if unit == 's':
+                values.append(elapsed)
+            else:
+                values.append(amount / elapsed / (1e6 if unit == 'MB/s' else 1))
+        best = min(values) if unit in self.LOWER_IS_BETTER else max(values)
+        result = {'unit': unit, 'value': best}
+        if track_memory:
+            # Traced separately: tracemalloc slows the timed runs down.
+            tracemalloc.start()
+            try:
+                run()
+                result['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+            finally:
+                tracemalloc.stop()
+        return result
+
+    def run(self, names: Optional[List[str]] = None, import_runs: int = 5) -> dict:
+        """
+        Runs the benchmark cases.
         
-        return '\n'.join(content)
+        Args:
+            names (Optional[List[str]]): Case names or prefixes to run (e.g.
+                'data.' or 'import.cold'); all cases when None.
+            import_runs (int): Interpreter launches for the cold import case.
+        
+        Returns:
+            dict: ``{'version', 'python', 'platform', 'scale', 'results'}``
+            where ``results`` maps case name to ``{'unit', 'value'[, 'peak_mb']}``.
+        """
+        import platform
 
-    def log_entry(self) -> str:
-        """Generate a log file entry"""
-        levels = ['INFO', 'WARNING', 'ERROR', 'DEBUG']
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        return f"{timestamp} [{random.choice(levels)}] {self.text.word(random.randint(5,10))}"
+        def selected(name):
+            return names is None or any(name == n or name.startswith(n) for n in names)
 
-    def config_ini(self) -> str:
-        """Generate INI configuration file content"""
-        sections = {
-            'database': {
-                'host': 'localhost',
-                'port': str(random.randint(3000, 9999)),
-                'username': self.text.username(),
-                'password': self.text.alphanumeric(12)
-            },
-            'api': {
-                'key': self.text.alphanumeric(32),
-                'timeout': str(random.randint(30, 300)),
-                'retry_limit': str(random.randint(1, 5))
-            }
+        results = {}
+        if selected('import.cold'):
+            results['import.cold'] = {'unit': 's', 'value': measure_import_time(import_runs)['seconds']}
+        with tempfile.TemporaryDirectory(prefix='soupbench-') as tmp:
+            self._tmp = tmp
+            for name, unit, run, track_memory in self.cases():
+                if selected(name):
+                    results[name] = self._measure(unit, run, track_memory)
+        return {
+            'version': self.VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scale': self.scale,
+            'results': results,
         }
+
+    @staticmethod
+    def save(report: dict, path) -> None:
+        """Writes a report as JSON."""
+        Path(path).write_text(json.dumps(report, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+    @staticmethod
+    def load(path) -> dict:
+        """Reads a JSON report."""
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+
+    @classmethod
+    def compare(cls, report: dict, baseline: dict, tolerance: float = 0.10) -> List[dict]:
+        """
+        Compares a report against a baseline.
         
-        content = []
-        for section, values in sections.items():
-            content.append(f"[{section}]")
-            content.extend(f"{k} = {v}" for k, v in values.items())
-            content.append("")
+        Args:
+            report (dict): The current results from ``run``.
+            baseline (dict): Stored results from an earlier ``run``.
+            tolerance (float): Allowed relative slowdown before a case counts
+                as a regression.
         
-        return '\n'.join(content)
+        Returns:
+            List[dict]: One ``{'name', 'unit', 'baseline', 'value', 'change'}``
+            entry per regressed case; ``change`` is the relative slowdown.
+        """
+        regressions = []
+        for name, result in report['results'].items():
+            base = baseline.get('results', {}).get(name)
+            if not base or base['unit'] != result['unit'] or not base['value']:
+                continue
+            if result['unit'] in cls.LOWER_IS_BETTER:
+                change = result['value'] / base['value'] - 1
+            else:
+                change = base['value'] / result['value'] - 1 if result['value'] else float('inf')
+            if change > tolerance:
+                regressions.append({'name': name, 'unit': result['unit'], 'baseline': base['value'],
+                                    'value': result['value'], 'change': change})
+        return regressions
 
 
-if __name__ == "__main__":
-    text_gen = TextGenerator()
-    print(text_gen.verb(2))
+class _Throughput:
+    """Live records/s and MB/s on stderr, redrawn at most every ``interval`` seconds."""
+
+    def __init__(self, total: int, unit: str = 'records', enabled: bool = True, interval: float = 0.5):
+        self.total = total
+        self.unit = unit
+        self.enabled = enabled
+        self.interval = interval
+        self.records = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self._shown = 0.0
+
+    def __call__(self, records: int, nbytes: int):
+        self.records += records
+        self.bytes += nbytes
+        now = time.perf_counter()
+        if self.enabled and now - self._shown >= self.interval:
+            self._shown = now
+            sys.stderr.write('\r' + self.line(now))
+            sys.stderr.flush()
+
+    def line(self, now: Optional[float] = None) -> str:
+        elapsed = max((now or time.perf_counter()) - self.started, 1e-9)
+        done = f"{self.records:,}/{self.total:,}" if self.total else f"{self.records:,}"
+        return (f"{done} {self.unit}  {self.records / elapsed:,.0f} {self.unit}/s  "
+                f"{self.bytes / elapsed / 1e6:,.1f} MB/s  {elapsed:.1f}s")
+
+    def abort(self):
+        """Stops reporting, ending a partially drawn line."""
+        if self.enabled and self._shown:
+            sys.stderr.write('\n')
+        self.enabled = False
+
+    def finish(self):
+        if self.enabled:
+            sys.stderr.write('\r' + self.line() + '\n')
+            sys.stderr.flush()
+
+
+# Record jobs: name -> (shard job, supported formats).
+_CLI_RECORDS = {
+    'people': ('people', ('csv', 'jsonl')),
+    'products': ('products', ('csv', 'jsonl')),
+    'csv': ('csv', ('csv',)),
+    'logs': ('logs', ('raw', 'jsonl')),
+    'tweets': ('tweets', ('raw', 'jsonl')),
+}
+
+
+def _cli_encode(job: str, fmt: str, result) -> Tuple[bytes, int]:
+    """Encodes one shard result; returns the bytes and the number of records."""
+    if job == 'csv':
+        return result, result.count(b'\n')
+    if isinstance(result, RecordBatch):
+        text = Schema.csv_chunk(result) if fmt == 'csv' else Schema.jsonl_chunk(result)
+        return text.encode('utf-8'), result.num_rows
+    if fmt == 'jsonl':
+        text = ''.join(json.dumps({'text': line}) + '\n' for line in result)
+    else:
+        text = ''.join(line + '\n' for line in result)
+    return text.encode('utf-8'), len(result)
+
+
+def _cli_header(job: str, fmt: str) -> bytes:
+    if fmt != 'csv':
+        return b''
+    if job == 'csv':
+        columns = FileGenerator.csv_headers
+    else:
+        columns = list(getattr(DataGenerator(0), job)(1).keys())
+    return (','.join(columns) + '\n').encode('utf-8')
+
+
+def _cli_records(args, pool: ParallelGenerator, progress: _Throughput) -> int:
+    job, formats = _CLI_RECORDS[args.command]
+    fmt = args.format or formats[0]
+    params = {'unique_ids': args.unique_ids} if job in ('people', 'products', 'csv') else {}
+    if job == 'logs':
+        params = {'rate': args.rate, 'distribution': args.distribution}
+    header = _cli_header(job, fmt)
+    shards = pool.map(job, args.count, params)
+
+    if args.output == '-':
+        out = sys.stdout.buffer
+        out.write(header)
+        for result in shards:
+            data, records = _cli_encode(job, fmt, result)
+            out.write(data)
+            progress(records, len(data))
+        out.flush()
+        return 0
+
+    directory = Path(args.output)
+    directory.mkdir(parents=True, exist_ok=True)
+    extension = 'txt' if fmt == 'raw' else fmt
+    with open(directory / args.manifest, 'w', newline='', encoding='utf-8') as f:
+        manifest = csv.writer(f)
+        manifest.writerow(['file', 'records', 'bytes'])
+        for shard, result in enumerate(shards):
+            data, records = _cli_encode(job, fmt, result)
+            name = f"{args.prefix or args.command}-{shard:05d}.{extension}"
+            with open(directory / name, 'wb') as part:
+                part.write(header)
+                part.write(data)
+            manifest.writerow([name, records, len(header) + len(data)])
+            progress(records, len(header) + len(data))
+    return 0
 
-    phrase_gen = PhraseGenerator()
-    print(phrase_gen.noam())
+
+def _cli_detach_stdout():
+    """
+    Points stdout at devnull after the reader of a pipeline went away (e.g.
+    ``| head``), so the interpreter's exit-time flush does not raise again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+def _parse_size(text: str) -> int:
+    """Parses a byte size such as '512', '64K', '10M' or '50G' (powers of 1024)."""
+    units = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*', text, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size '{text}'.")
+    return int(float(match.group(1)) * units[match.group(2).upper()])
+
+
+def _cli_corpus(args) -> int:
+    corpus = CorpusGenerator(args.seed, args.format, args.doc_bytes, args.sigma)
+    progress = _Throughput(args.count or 0, 'documents', enabled=not args.quiet)
+    try:
+        if args.output == '-':
+            out = sys.stdout.buffer
+            for docs in corpus.documents(args.count, args.size):
+                data = ('\n'.join(doc for _, doc in docs) + '\n').encode('utf-8')
+                out.write(data)
+                progress(len(docs), len(data))
+            out.flush()
+        else:
+            corpus.write_files(args.output, args.size, args.count, manifest=args.manifest, progress=progress)
+    except BrokenPipeError:
+        progress.abort()
+        raise
+    finally:
+        progress.finish()
+    return 0
+
+
+def _cli_bench(args) -> int:
+    report = Benchmark(args.scale, args.repeat, args.seed or 0).run(args.cases, args.import_runs)
+    for name, result in report['results'].items():
+        print(f"{name:<24} {result['value']:>14,.3f} {result['unit']}")
+    if args.save:
+        Benchmark.save(report, args.save)
+    if args.baseline:
+        regressions = Benchmark.compare(report, Benchmark.load(args.baseline), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['name']}: {r['baseline']:,.3f} -> {r['value']:,.3f} {r['unit']} "
+                  f"({r['change']:+.1%})", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (``python SoupGenerator.py <command> ...``).
+    
+    Record commands (people, products, csv, logs, tweets) write one file per
+    shard plus a CSV manifest into ``--output``, or a single stream to
+    stdout with ``-o -``. Media commands (images, audio) write one file per
+    item plus a manifest; ``corpus`` writes documents up to ``--size``. Throughput is reported live on stderr. Without a
+    command, a couple of sample strings are printed.
+    
+    Args:
+        argv (Optional[List[str]]): Arguments; defaults to ``sys.argv[1:]``.
+    
+    Returns:
+        int: The process exit status.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='SoupGenerator', description='Generate test data in bulk.')
+    commands = parser.add_subparsers(dest='command')
+
+    shared = argparse.ArgumentParser(add_help=False)
+    shared.add_argument('-n', '--count', type=int, default=1000, help='number of records or files')
+    shared.add_argument('-s', '--seed', type=int, help='seed for reproducible output')
+    shared.add_argument('-w', '--workers', type=int, help='worker processes (default: CPU count)')
+    shared.add_argument('--shard-size', type=int,
+                        help='records or files per shard (default: 10000 records; files are sized to the workers)')
+    shared.add_argument('--prefix', help='output file name prefix')
+    shared.add_argument('--manifest', default='manifest.csv', help='manifest file name')
+    shared.add_argument('-q', '--quiet', action='store_true', help='do not report progress')
+
+    for name, (_, formats) in _CLI_RECORDS.items():
+        cmd = commands.add_parser(name, parents=[shared], help=f'generate {name} records')
+        cmd.add_argument('-o', '--output', default='-', help="output directory, or '-' for stdout")
+        cmd.add_argument('-f', '--format', choices=formats, help=f'output format (default: {formats[0]})')
+        if name in ('people', 'products', 'csv'):
+            cmd.add_argument('--unique-ids', action='store_true', help='never repeat ids')
+        if name == 'logs':
+            cmd.add_argument('--rate', type=float, default=1000.0, help='mean events per simulated second')
+            cmd.add_argument('--distribution', default='poisson', choices=LogStream.DISTRIBUTIONS)
+
+    cmd = commands.add_parser('images', parents=[shared], help='generate an image dataset')
+    cmd.add_argument('-o', '--output', required=True, help='output directory')
+    cmd.add_argument('--width', type=int, default=256)
+    cmd.add_argument('--height', type=int, default=256)
+    cmd.add_argument('--kind', default='rgb', help="'gray', 'rgb' or a pattern type")
+    cmd.add_argument('-f', '--format', default='png', choices=list(_IMAGE_FORMATS))
+    cmd.add_argument('--compress-level', type=int, default=6, help='PNG zlib level, 0-9')
+    cmd.add_argument('--quality', type=int, default=90, help='JPEG/WebP quality, 1-100')
+
+    cmd = commands.add_parser('audio', parents=[shared], help='generate WAV files')
+    cmd.add_argument('-o', '--output', required=True, help='output directory')
+    cmd.add_argument('--duration', type=float, default=1.0, help='seconds per file')
+    cmd.add_argument('--sample-rate', type=int, default=44100)
+    cmd.add_argument('--kind', default='noise', choices=['noise', 'tone'])
+    cmd.add_argument('--frequency', type=float, default=440.0, help='tone frequency in Hz')
+
+    cmd = commands.add_parser('corpus', help='generate a document corpus up to a total size')
+    cmd.add_argument('--size', type=_parse_size, required=True, help="total size, e.g. '500M' or '50G'")
+    cmd.add_argument('-n', '--count', type=int, help='maximum number of documents')
+    cmd.add_argument('-s', '--seed', type=int, help='seed for reproducible output')
+    cmd.add_argument('-f', '--format', default='markdown', choices=list(CorpusGenerator.FORMATS))
+    cmd.add_argument('--doc-bytes', type=_parse_size, default=8192, help='median document size')
+    cmd.add_argument('--sigma', type=float, default=1.0, help='log-normal spread of document sizes')
+    cmd.add_argument('-o', '--output', default='-', help="output directory (one file per document), or '-'")
+    cmd.add_argument('--manifest', default='manifest.csv', help='manifest file name')
+    cmd.add_argument('-q', '--quiet', action='store_true', help='do not report progress')
+
+    cmd = commands.add_parser('bench', help='run the benchmark suite')
+    cmd.add_argument('cases', nargs='*', help='case names or prefixes (default: all)')
+    cmd.add_argument('--scale', type=float, default=1.0)
+    cmd.add_argument('--repeat', type=int, default=3)
+    cmd.add_argument('-s', '--seed', type=int)
+    cmd.add_argument('--import-runs', type=int, default=5)
+    cmd.add_argument('--save', help='write the report as JSON')
+    cmd.add_argument('--baseline', help='compare against a saved report; exit 1 on regressions')
+    cmd.add_argument('--tolerance', type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        print(TextGenerator().verb(2))
+        print(PhraseGenerator().noam())
+        return 0
+    if args.command == 'bench':
+        args.cases = args.cases or None
+        return _cli_bench(args)
+    if args.command == 'corpus':
+        try:
+            return _cli_corpus(args)
+        except BrokenPipeError:
+            _cli_detach_stdout()
+            return 0
+
+    pool = ParallelGenerator(args.seed, args.workers, args.shard_size or 10000, args.shard_size)
+    unit = 'records' if args.command in _CLI_RECORDS else 'files'
+    progress = _Throughput(args.count, unit, enabled=not args.quiet)
+    try:
+        if args.command in _CLI_RECORDS:
+            return _cli_records(args, pool, progress)
+        if args.command == 'images':
+            pool.images(args.output, args.count, args.width, args.height, args.kind, args.prefix or 'image_',
+                        args.format, args.compress_level, args.quality, args.manifest, progress)
+        else:
+            pool.audio(args.output, args.count, args.duration, args.sample_rate, args.kind, args.frequency,
+                       args.prefix or 'audio_', args.manifest, progress)
+        return 0
+    except BrokenPipeError:
+        progress.abort()
+        _cli_detach_stdout()
+        return 0
+    finally:
+        progress.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())